@@ -0,0 +1,162 @@
+"""
+Бенчмарки этапов PCA на синтетических данных.
+
+Запуск из корня репозитория:
+  python -m benchmarks.bench_pca --sizes 200x10x2,1000x30x5 --out bench.json
+  python -m benchmarks.bench_pca --compare bench.json --tolerance 0.2
+
+Для каждой точки сетки (n, m, k) и каждого этапа измеряется лучшее время
+из --repeat запусков и пиковая память (tracemalloc, отдельным прогоном,
+чтобы трассировка не искажала время). Данные генерируются с фиксированным
+зерном. В режиме --compare новые результаты сравниваются с сохранённой
+базой; при регрессии сверх допуска код возврата 1.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from src.Matrix import Matrix
+from src.center_data import center_data
+from src.covariance_matrix import covariance_matrix
+from src.find_eigenvalues import find_eigenvalues
+from src.find_eigenvectors import find_eigenvectors
+from src.gauss_solver import gauss_solver
+from src.knn_accuracy import knn_accuracy
+from src.pca import pca
+
+DEFAULT_SIZES = "200x8x2,1000x16x4,2000x32x4"
+
+
+def make_data(n: int, m: int, seed: int) -> Tuple[Matrix, List[int]]:
+    """Данные с убывающим спектром и метки двух классов."""
+    rng = random.Random(seed)
+    scales = [1.0 / (1 + j) for j in range(m)]
+    rows = [[rng.gauss(0.0, s) for s in scales] for _ in range(n)]
+    labels = [int(row[0] > 0) for row in rows]
+    return Matrix(rows), labels
+
+
+def stages(n: int, m: int, k: int, seed: int) -> Dict[str, Callable[[], object]]:
+    X, labels = make_data(n, m, seed)
+    Xc = center_data(X)
+    C = covariance_matrix(Xc)
+    eigenvalues = find_eigenvalues(C)
+    rng = random.Random(seed + 1)
+    A = Matrix([[rng.gauss(0.0, 1.0) + (m if i == j else 0.0) for j in range(m)]
+                for i in range(m)])
+    b = Matrix([[rng.gauss(0.0, 1.0)] for _ in range(m)])
+    W = Matrix([[rng.gauss(0.0, 1.0) for _ in range(k)] for _ in range(m)])
+    rows = X.tolist()
+    return {
+        "matmul": lambda: X @ W,
+        "transpose": lambda: X.transpose(),
+        "center_data": lambda: center_data(X),
+        "covariance_matrix": lambda: covariance_matrix(Xc),
+        "find_eigenvalues": lambda: find_eigenvalues(C),
+        "find_eigenvectors": lambda: find_eigenvectors(C, eigenvalues),
+        "pca": lambda: pca(X, k),
+        "knn_accuracy": lambda: knn_accuracy(rows, labels),
+        "gauss_solver": lambda: gauss_solver(A, b),
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes: List[Tuple[int, int, int]], repeat: int, seed: int,
+        only: List[str] = None) -> Dict[str, object]:
+    results = []
+    for n, m, k in sizes:
+        for name, fn in stages(n, m, k, seed).items():
+            if only and name not in only:
+                continue
+            random.seed(seed)  # степенной метод использует глобальный random
+            wall, peak = measure(fn, repeat)
+            results.append({"stage": name, "n": n, "m": m, "k": k,
+                            "time": wall, "peak_bytes": peak})
+            print(f"{name:>18} n={n:<6} m={m:<4} k={k:<3} "
+                  f"{wall * 1e3:10.2f} ms {peak / 1024:10.1f} KiB", file=sys.stderr)
+    return {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                 "repeat": repeat, "seed": seed, "created": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Список регрессий: время или память выросли больше чем на tolerance."""
+    base = {(r["stage"], r["n"], r["m"], r["k"]): r for r in baseline["results"]}
+    problems = []
+    for r in current["results"]:
+        key = (r["stage"], r["n"], r["m"], r["k"])
+        old = base.get(key)
+        if old is None:
+            continue
+        for field in ("time", "peak_bytes"):
+            if old[field] > 0 and r[field] > old[field] * (1 + tolerance):
+                problems.append(f"{key[0]} n={key[1]} m={key[2]} k={key[3]}: {field} "
+                                f"{old[field]:.6g} -> {r[field]:.6g} "
+                                f"(+{(r[field] / old[field] - 1) * 100:.1f}%)")
+    return problems
+
+
+def parse_sizes(text: str) -> List[Tuple[int, int, int]]:
+    sizes = []
+    for item in text.split(','):
+        n, m, k = (int(v) for v in item.lower().split('x'))
+        sizes.append((n, m, k))
+    return sizes
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки этапов PCA")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="сетка n×m×k через запятую")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stages", default=None, help="только эти этапы, через запятую")
+    parser.add_argument("--out", default=None, help="куда записать JSON (по умолчанию stdout)")
+    parser.add_argument("--compare", default=None, help="JSON с базовыми результатами")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="допустимый относительный рост времени/памяти")
+    args = parser.parse_args(argv)
+
+    only = args.stages.split(',') if args.stages else None
+    report = run(parse_sizes(args.sizes), args.repeat, args.seed, only)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    elif not args.compare:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        problems = compare(report, baseline, args.tolerance)
+        for line in problems:
+            print("REGRESSION", line)
+        if problems:
+            return 1
+        print("Регрессий не обнаружено")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,159 @@
+import sys
+from array import array
+from itertools import chain
+from operator import add, sub, mul
+
+# Форматы буфера, которые читаются как double без копирования: сами double
+# в родном порядке байт и сырые байты (bytearray, mmap, bytes)
+_DOUBLE_FORMATS = ('d', '@d', '=d', '<d' if sys.byteorder == 'little' else '>d')
+_BYTE_FORMATS = ('B', 'b', 'c')
+
+
 class Matrix:
-    def __init__(self, data):
+    """
+    Плотная матрица n×m над непрерывным буфером чисел double.
+
+    Элементы лежат в плоском буфере (по умолчанию array('d')) построчно
+    (order='C') или по столбцам (order='F'); strides — шаги в элементах
+    между соседними строками и столбцами. data — кортеж memoryview строк
+    над этим буфером: data[i][j] читается и присваивается так же, как у
+    вложенных списков, а строка целиком заменяется только через срез
+    data[i][:] = ...; присваивание data[i] = ... отвергается (TypeError),
+    поскольку оторвало бы строку от буфера.
+    """
+
+    def __init__(self, data, order: str = 'C'):
+        if order not in ('C', 'F'):
+            raise ValueError("order должен быть 'C' или 'F'")
         if isinstance(data, tuple):
             n, m = data
-            self.data = [[0.0] * m for _ in range(n)]
-        else:
-            self.data = [list(map(float, row)) for row in data]
-        self.rows = len(self.data)
-        self.cols = len(self.data[0]) if self.rows > 0 else 0
+            self._bind(array('d', bytes(8 * n * m)), n, m, order)
+            return
+        if order != 'C':
+            raise ValueError("Из вложенных последовательностей строится только order='C'")
+        buf = array('d')
+        n, m = 0, 0
+        for row in data:
+            before = len(buf)
+            buf.extend(map(float, row))
+            width = len(buf) - before
+            if n == 0:
+                m = width
+            elif width != m:
+                raise ValueError("Строки матрицы должны иметь одинаковую длину")
+            n += 1
+        self._bind(buf, n, m, 'C')
+
+    @classmethod
+    def from_buffer(cls, buffer, shape=None, order: str = 'C') -> 'Matrix':
+        """
+        Оборачивает объект с буферным протоколом (array('d'), bytearray,
+        mmap, memoryview, numpy.ndarray float64) без копирования.
+
+        Вход:
+          buffer: непрерывный (C-contiguous) буфер из n*m чисел double
+                  или сырых байтов; буферы других типов (например,
+                  array('q')) отвергаются — их нужно привести к
+                  array('d') явно
+          shape:  (n, m); можно опустить для двумерного буфера
+          order:  'C' — буфер хранит строки подряд, 'F' — столбцы
+        Выход:
+          Matrix, разделяющая память с buffer
+        """
+        if order not in ('C', 'F'):
+            raise ValueError("order должен быть 'C' или 'F'")
+        view = memoryview(buffer)
+        if shape is None:
+            if view.ndim != 2:
+                raise ValueError("Для неодномерного буфера нужно указать shape")
+            shape = view.shape if order == 'C' else view.shape[::-1]
+        if not view.c_contiguous:
+            raise ValueError("Буфер должен быть непрерывным (C-contiguous)")
+        if view.format not in _DOUBLE_FORMATS + _BYTE_FORMATS:
+            raise ValueError(f"Буфер формата '{view.format}' не является буфером double; "
+                             "преобразуйте его через array('d', ...)")
+        if view.ndim != 1 or view.format != 'd':
+            if view.format in _BYTE_FORMATS and view.nbytes % 8:
+                raise ValueError(f"Размер буфера {view.nbytes} байт не кратен 8")
+            view = view.cast('B').cast('d')
+        n, m = shape
+        if len(view) != n * m:
+            raise ValueError(f"Размер буфера {len(view)} не соответствует форме {n}×{m}")
+        res = cls.__new__(cls)
+        res._bind(view, n, m, order)
+        return res
+
+    def _bind(self, buf, rows: int, cols: int, order: str):
+        self._buf = buf
+        self._view = memoryview(buf)
+        self.rows = rows
+        self.cols = cols
+        self.order = order
+        self.strides = (cols, 1) if order == 'C' else (1, rows)
+        rs, cs = self.strides
+        span = (cols - 1) * cs + 1 if cols > 0 else 0
+        view = self._view
+        self.data = tuple(view[i * rs:i * rs + span:cs] for i in range(rows))
 
     def shape(self):
         return (self.rows, self.cols)
 
+    def _column(self, j: int, start: int = 0, stop: int = None) -> memoryview:
+        """Представление строк [start, stop) j-го столбца без копирования."""
+        if stop is None:
+            stop = self.rows
+        if stop <= start:
+            return self._view[0:0]
+        rs, cs = self.strides
+        first = start * rs + j * cs
+        return self._view[first:first + (stop - start - 1) * rs + 1:rs]
+
+    def row_block(self, start: int, stop: int) -> 'Matrix':
+        """Строки [start, stop) как Matrix; для order='C' — без копирования."""
+        stop = min(stop, self.rows)
+        start = min(start, stop)
+        if self.order == 'C':
+            m = self.cols
+            return Matrix.from_buffer(self._view[start * m:stop * m], (stop - start, m))
+        res = Matrix((stop - start, self.cols))
+        for i in range(start, stop):
+            res.data[i - start][:] = self.data[i]
+        return res
+
+    def _values(self):
+        """Все элементы построчно (плоский memoryview для order='C')."""
+        if self.order == 'C':
+            return self._view
+        return chain.from_iterable(self.data)
+
+    def as_buffer(self) -> memoryview:
+        """
+        memoryview формы (rows, cols) над хранилищем, без копирования.
+        Для order='F' форма (cols, rows) — это буфер транспонированной
+        матрицы. numpy.asarray(M.as_buffer()) разделяет память с M.
+        """
+        shape = (self.rows, self.cols) if self.order == 'C' else (self.cols, self.rows)
+        if self.rows == 0 or self.cols == 0:
+            return self._view[0:0]
+        return self._view.cast('B').cast('d', shape)
+
+    def __buffer__(self, flags):
+        return self.as_buffer()
+
+    def __reduce__(self):
+        return (Matrix.from_buffer, (array('d', self._values()), (self.rows, self.cols)))
+
+    def copy(self) -> 'Matrix':
+        return Matrix.from_buffer(array('d', self._values()), (self.rows, self.cols))
+
+    def tolist(self):
+        return [row.tolist() for row in self.data]
+
     def transpose(self):
         res = Matrix((self.cols, self.rows))
-        for i in range(self.rows):
-            for j in range(self.cols):
-                res.data[j][i] = self.data[i][j]
+        n = self.rows
+        for j in range(self.cols):
+            res._view[j * n:(j + 1) * n] = self._column(j)
         return res
 
     def __add__(self, other):
@@ -23,48 +161,46 @@ class Matrix:
             raise TypeError("Можно складывать только Matrix с Matrix")
         if self.shape() != other.shape():
             raise ValueError("Размерности матриц не совпадают")
-        res = Matrix((self.rows, self.cols))
-        for i in range(self.rows):
-            for j in range(self.cols):
-                res.data[i][j] = self.data[i][j] + other.data[i][j]
-        return res
+        return Matrix.from_buffer(array('d', map(add, self._values(), other._values())),
+                                  (self.rows, self.cols))
 
     def __sub__(self, other):
         if not isinstance(other, Matrix):
             raise TypeError("Можно вычитать только Matrix из Matrix")
         if self.shape() != other.shape():
             raise ValueError("Размерности матриц не совпадают")
-        res = Matrix((self.rows, self.cols))
-        for i in range(self.rows):
-            for j in range(self.cols):
-                res.data[i][j] = self.data[i][j] - other.data[i][j]
-        return res
+        return Matrix.from_buffer(array('d', map(sub, self._values(), other._values())),
+                                  (self.rows, self.cols))
 
     def __matmul__(self, other):
+        if getattr(other, 'is_sparse', False):
+            return NotImplemented
         if not isinstance(other, Matrix):
             raise TypeError("Оператор @ доступен только для двух объектов Matrix")
         if self.cols != other.rows:
             raise ValueError("Несогласованные размеры матриц для умножения")
-        res = Matrix((self.rows, other.cols))
-        for i in range(self.rows):
-            for k in range(self.cols):
-                a_val = self.data[i][k]
-                if a_val != 0.0:
-                    for j in range(other.cols):
-                        res.data[i][j] += a_val * other.data[k][j]
-        return res
+        from src import parallel
+        if parallel.should_parallelize(self.rows * self.cols * other.cols, self.rows):
+            return parallel.matmul(self, other)
+        # Столбцы правого операнда копируются один раз, далее каждый элемент
+        # результата — скалярное произведение строки на столбец.
+        cols = [other._column(j).tolist() for j in range(other.cols)]
+        out = array('d')
+        for row in self.data:
+            r = row.tolist()
+            out.extend([sum(map(mul, r, c)) for c in cols])
+        return Matrix.from_buffer(out, (self.rows, other.cols))
 
     def __repr__(self):
-        return "Matrix(" + str(self.data) + ")"
+        return "Matrix(" + str(self.tolist()) + ")"
 
     def __eq__(self, other):
         if not isinstance(other, Matrix) or self.shape() != other.shape():
             return False
         eps = 1e-9
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if abs(self.data[i][j] - other.data[i][j]) > eps:
-                    return False
+        for a, b in zip(self._values(), other._values()):
+            if abs(a - b) > eps:
+                return False
         return True
 
     def __getitem__(self, idx):
@@ -0,0 +1,149 @@
+from array import array
+from typing import List, Tuple
+from src.Matrix import Matrix
+
+
+class SparseMatrix:
+    """
+    Разреженная матрица n×m в формате CSR.
+
+    Хранятся только ненулевые элементы: data — значения, indices — номера
+    столбцов, indptr — границы строк (элементы строки i лежат в
+    data[indptr[i]:indptr[i+1]]). Память O(nnz) вместо O(n·m).
+    Поддерживает @ и transpose вместе с Matrix; pca и covariance_matrix
+    работают с ней через неявное центрирование, без уплотнения.
+    """
+
+    is_sparse = True
+
+    def __init__(self, data, indices, indptr, shape: Tuple[int, int]):
+        self.data = array('d', data)
+        self.indices = array('q', indices)
+        self.indptr = array('q', indptr)
+        self.rows, self.cols = shape
+        if len(self.indptr) != self.rows + 1 or len(self.data) != len(self.indices):
+            raise ValueError("Некорректная CSR-структура")
+        if self.indptr[-1] != len(self.data):
+            raise ValueError("indptr не соответствует числу ненулевых элементов")
+
+    @classmethod
+    def from_dense(cls, X) -> 'SparseMatrix':
+        """Строит CSR из Matrix или последовательности строк, отбрасывая нули."""
+        rows = X.data if isinstance(X, Matrix) else X
+        data, indices, indptr = array('d'), array('q'), array('q', [0])
+        m = X.cols if isinstance(X, Matrix) else None
+        for row in rows:
+            if m is None:
+                m = len(row)
+            for j, v in enumerate(row):
+                if v != 0.0:
+                    data.append(float(v))
+                    indices.append(j)
+            indptr.append(len(data))
+        return cls(data, indices, indptr, (len(indptr) - 1, m or 0))
+
+    def shape(self):
+        return (self.rows, self.cols)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def to_dense(self) -> Matrix:
+        res = Matrix((self.rows, self.cols))
+        data, indices, indptr = self.data, self.indices, self.indptr
+        for i, row in enumerate(res.data):
+            for p in range(indptr[i], indptr[i + 1]):
+                row[indices[p]] = data[p]
+        return res
+
+    def row_block(self, start: int, stop: int) -> 'SparseMatrix':
+        stop = min(stop, self.rows)
+        start = min(start, stop)
+        lo, hi = self.indptr[start], self.indptr[stop]
+        return SparseMatrix(self.data[lo:hi], self.indices[lo:hi],
+                            [p - lo for p in self.indptr[start:stop + 1]],
+                            (stop - start, self.cols))
+
+    def transpose(self) -> 'SparseMatrix':
+        """CSR транспонированной матрицы (сортировка подсчётом по столбцам)."""
+        counts = [0] * (self.cols + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(self.cols):
+            counts[j + 1] += counts[j]
+        indptr = array('q', counts)
+        fill = counts[:-1]
+        data = array('d', bytes(8 * self.nnz))
+        indices = array('q', bytes(8 * self.nnz))
+        src_data, src_idx, src_ptr = self.data, self.indices, self.indptr
+        for i in range(self.rows):
+            for p in range(src_ptr[i], src_ptr[i + 1]):
+                j = src_idx[p]
+                q = fill[j]
+                data[q] = src_data[p]
+                indices[q] = i
+                fill[j] = q + 1
+        return SparseMatrix(data, indices, indptr, (self.cols, self.rows))
+
+    def __matmul__(self, other):
+        if isinstance(other, SparseMatrix):
+            return self @ other.to_dense()
+        if not isinstance(other, Matrix):
+            raise TypeError("Оператор @ доступен только для Matrix и SparseMatrix")
+        if self.cols != other.rows:
+            raise ValueError("Несогласованные размеры матриц для умножения")
+        p = other.cols
+        rows_b = [row.tolist() for row in other.data]
+        out = array('d')
+        data, indices, indptr = self.data, self.indices, self.indptr
+        for i in range(self.rows):
+            acc = [0.0] * p
+            for q in range(indptr[i], indptr[i + 1]):
+                a = data[q]
+                acc = [s + a * b for s, b in zip(acc, rows_b[indices[q]])]
+            out.extend(acc)
+        return Matrix.from_buffer(out, (self.rows, p))
+
+    def __rmatmul__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        # A·S = (Sᵀ·Aᵀ)ᵀ
+        return (self.transpose() @ other.transpose()).transpose()
+
+    def column_sums(self) -> List[float]:
+        sums = [0.0] * self.cols
+        for j, v in zip(self.indices, self.data):
+            sums[j] += v
+        return sums
+
+    def column_sq_sums(self) -> List[float]:
+        sums = [0.0] * self.cols
+        for j, v in zip(self.indices, self.data):
+            sums[j] += v * v
+        return sums
+
+    def mean_covariance(self) -> Tuple[List[float], Matrix]:
+        """
+        Средние и ковариация с неявным центрированием:
+          C = (XᵀX − n·μμᵀ) / (n − 1),
+        где XᵀX накапливается только по парам ненулевых элементов строк.
+        """
+        n, m = self.rows, self.cols
+        means = [s / n for s in self.column_sums()] if n else [0.0] * m
+        gram = [[0.0] * m for _ in range(m)]
+        data, indices, indptr = self.data, self.indices, self.indptr
+        for i in range(n):
+            lo, hi = indptr[i], indptr[i + 1]
+            nz = sorted(zip(indices[lo:hi], data[lo:hi]))
+            for a, (ja, va) in enumerate(nz):
+                row = gram[ja]
+                for jb, vb in nz[a:]:
+                    row[jb] += va * vb
+        denom = n - 1 if n > 1 else 1
+        out = array('d')
+        for i in range(m):
+            mi = n * means[i]
+            out.extend([((gram[i][j] if j >= i else gram[j][i]) - mi * means[j]) / denom
+                        for j in range(m)])
+        return means, Matrix.from_buffer(out, (m, m))
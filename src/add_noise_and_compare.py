@@ -1,21 +1,25 @@
-from typing import Any, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Sequence
 import random
 import math
-from src.center_data import center_data
+from src import parallel
 from src.Matrix import Matrix
-from src.covariance_matrix import covariance_matrix
-from src.find_eigenvalues import find_eigenvalues
 from src.auto_select_k import auto_select_k
-from src.pca import pca
+from src.pca import fit_pca
+from src.pca_cache import PCACache, cached
+from src.pca_model import PCAModel
+from src.streaming_covariance import streaming_mean_covariance
 from src.reconstruction_error import reconstruction_error
+from src.symmetric_eigen import symmetric_eigen
 
-def add_noise_and_compare(X: Matrix, noise_level: float = 0.1) -> Dict[str, Any]:
+def add_noise_and_compare(X: Matrix, noise_level: float = 0.1, seed: int = None) -> Dict[str, Any]:
     """
     Добавляет гауссов шум к данным и сравнивает результаты PCA до и после.
 
     Вход:
       X: матрица данных (n×m)
       noise_level: уровень шума (доля от σ каждого признака)
+      seed: зерно генератора шума (None — случайное)
     Выход:
       {
         "k": int,               # число PCA-компонент
@@ -25,54 +29,28 @@ def add_noise_and_compare(X: Matrix, noise_level: float = 0.1) -> Dict[str, Any]
         "noisy_proj": Matrix    # проекция зашумлённых (n×k)
       }
     """
-    n, m = X.rows, X.cols
-
-    # 1) Авто-подбор k на основе C(X_centered)
-    Xc = center_data(X)
-    C  = covariance_matrix(Xc)
-    ev = find_eigenvalues(C)
-    k0 = auto_select_k(ev)
-    k  = max(k0, 2)        # минимум 2 компоненты для визуализации
-
-    # 2) PCA на исходных данных
-    Xp, gamma0, W, means = pca(X, k)
+    # 1-2) Авто-подбор k и PCA на исходных данных
+    cache = PCACache()
+    model = _fit_clean(X, cache)
+    k = model.k
+    Xp, gamma0 = model.transform(X), model.gamma
 
     # 3) Восстановление и MSE для исходных
-    Wt   = W.transpose()
-    Xrec = Xp @ Wt
-    Xorig_recon = Matrix((n, m))
-    for i in range(n):
-        for j in range(m):
-            Xorig_recon.data[i][j] = Xrec.data[i][j] + means[j]
-    mse0 = reconstruction_error(X, Xorig_recon)
-
-    # 4) Стандартные отклонения по столбцам
-    stds = []
-    for j in range(m):
-        col = [X.data[i][j] for i in range(n)]
-        mu  = sum(col) / n
-        var = sum((v - mu)**2 for v in col) / (n - 1) if n > 1 else 0.0
-        stds.append(math.sqrt(var))
+    mse0 = reconstruction_error(X, model.inverse_transform(Xp))
+
+    # 4) Стандартные отклонения по столбцам — из диагонали C, уже
+    #    посчитанной на шаге 1
+    stds = _column_stds(X, cache)
 
     # 5) Формируем зашумлённые данные
-    noisy = [
-        [X.data[i][j] + random.gauss(0, noise_level * stds[j])
-         for j in range(m)]
-        for i in range(n)
-    ]
-    Xn = Matrix(noisy)
+    Xn = _add_noise(X, [noise_level * s for s in stds], random.Random(seed))
 
     # 6) PCA на зашумлённых (те же k)
-    Xpn, gamma1, Wn, means_n = pca(Xn, k)
+    noisy_model = PCAModel(k).fit(Xn)
+    Xpn, gamma1 = noisy_model.transform(Xn), noisy_model.gamma
 
     # 7) Восстановление и MSE для зашумлённых
-    Wnt   = Wn.transpose()
-    Xnrec = Xpn @ Wnt
-    Xnoisy_recon = Matrix((n, m))
-    for i in range(n):
-        for j in range(m):
-            Xnoisy_recon.data[i][j] = Xnrec.data[i][j] + means_n[j]
-    mse1 = reconstruction_error(Xn, Xnoisy_recon)
+    mse1 = reconstruction_error(Xn, noisy_model.inverse_transform(Xpn))
 
     return {
         "k": k,
@@ -80,4 +58,135 @@ def add_noise_and_compare(X: Matrix, noise_level: float = 0.1) -> Dict[str, Any]
         "noisy": {"gamma": gamma1, "mse": mse1},
         "proj": Xp,
         "noisy_proj": Xpn
-    }
\ No newline at end of file
+    }
+
+
+def noise_study(X: Matrix, noise_levels: Sequence[float], trials: int = 10,
+                seed: int = 0, n_jobs: int = None) -> Dict[str, Any]:
+    """
+    Monte-Carlo оценка устойчивости PCA к шуму: для каждого уровня шума
+    trials раз строятся зашумлённые данные и заново обучается PCA.
+
+    Исходное разложение строится один раз. Шум каждой попытки берётся из
+    собственного генератора random.Random, зерно которого определяется
+    (seed, номер уровня, номер попытки), поэтому результат не зависит от
+    числа процессов и порядка выполнения.
+
+    Вход:
+      X:            матрица данных (n×m)
+      noise_levels: уровни шума (доли от σ каждого признака)
+      trials:       число попыток на уровень
+      seed:         базовое зерно
+      n_jobs:       число процессов; None — parallel.get_num_workers()
+                    (общая настройка, см. parallel.set_num_workers), 1 — без пула
+    Выход:
+      {
+        "k": int,
+        "orig": {"gamma":…, "mse":…},
+        "levels": [
+          {"noise_level": float, "trials": int,
+           "gamma": {"mean":…, "std":…},
+           "mse":   {"mean":…, "std":…},
+           "angles": {"mean": list[float],   # средние главные углы (рад.)
+                      "max":  {"mean":…, "std":…}}},  # наибольший угол
+          …
+        ]
+      }
+    """
+    if trials < 1:
+        raise ValueError("trials должно быть не меньше 1")
+    cache = PCACache()
+    model = _fit_clean(X, cache)
+    mse0 = reconstruction_error(X, model.inverse_transform(model.transform(X)))
+    stds = _column_stds(X, cache)
+
+    tasks = [(level, f"{seed}/{li}/{t}")
+             for li, level in enumerate(noise_levels) for t in range(trials)]
+    context = (X, model.W, stds, model.k)
+    workers = parallel.get_num_workers() if n_jobs is None else n_jobs
+    if workers == 1 or len(tasks) <= 1:
+        outcomes = [_run_trial(context, *task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=context) as pool:
+            outcomes = list(pool.map(_noise_trial, *zip(*tasks)))
+
+    levels = []
+    for li, level in enumerate(noise_levels):
+        chunk = outcomes[li * trials:(li + 1) * trials]
+        angles = [a for _, _, a in chunk]
+        levels.append({
+            "noise_level": level,
+            "trials": trials,
+            "gamma": _summary([g for g, _, _ in chunk]),
+            "mse": _summary([e for _, e, _ in chunk]),
+            "angles": {
+                "mean": [sum(col) / trials for col in zip(*angles)],
+                "max": _summary([max(a) for a in angles]),
+            },
+        })
+    return {"k": model.k, "orig": {"gamma": model.gamma, "mse": mse0}, "levels": levels}
+
+
+def subspace_angles(W1: Matrix, W2: Matrix) -> List[float]:
+    """
+    Главные углы (в радианах, по возрастанию) между подпространствами,
+    натянутыми на ортонормированные столбцы W1 и W2 (m×k).
+
+    Косинусы углов — сингулярные числа M = W1ᵀW2, то есть корни
+    собственных значений MᵀM.
+    """
+    if W1.rows != W2.rows:
+        raise ValueError("W1 и W2 должны иметь одинаковое число строк")
+    M = W1.transpose() @ W2
+    eigenvalues, _ = symmetric_eigen(M.transpose() @ M)
+    return [math.acos(min(1.0, math.sqrt(max(lam, 0.0)))) for lam in eigenvalues]
+
+
+def _fit_clean(X: Matrix, cache: PCACache) -> PCAModel:
+    """PCA исходных данных с k по auto_select_k (не меньше 2)."""
+    # Средние, C и собственные пары остаются в кэше и переиспользуются
+    ev = fit_pca(X, solver='eigh', cache=cache)[2]
+    k = max(auto_select_k(ev), 2)        # минимум 2 компоненты для визуализации
+    return PCAModel(k, solver='eigh', cache=cache).fit(X)
+
+
+def _column_stds(X: Matrix, cache: PCACache) -> List[float]:
+    """σ по столбцам — корни диагонали закэшированной C."""
+    _, C = cached(cache, (cache.fingerprint(X), 'stats'),
+                  lambda: streaming_mean_covariance([X]))
+    return [math.sqrt(max(C.data[j][j], 0.0)) for j in range(X.cols)]
+
+
+def _add_noise(X: Matrix, sigmas: List[float], rng: random.Random) -> Matrix:
+    gauss = rng.gauss
+    return Matrix([[v + gauss(0.0, s) for v, s in zip(row, sigmas)] for row in X.data])
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    n = len(values)
+    mean = sum(values) / n
+    var = sum((v - mean) ** 2 for v in values) / (n - 1) if n > 1 else 0.0
+    return {"mean": mean, "std": math.sqrt(var)}
+
+
+# Общие для всех попыток данные процесса-исполнителя (задаются один раз
+# инициализатором пула; в текущем процессе не используются)
+_context = None
+
+
+def _init_worker(X: Matrix, W: Matrix, stds: List[float], k: int):
+    global _context
+    _context = (X, W, stds, k)
+
+
+def _noise_trial(noise_level: float, seed: str):
+    return _run_trial(_context, noise_level, seed)
+
+
+def _run_trial(context, noise_level: float, seed: str):
+    X, W, stds, k = context
+    Xn = _add_noise(X, [noise_level * s for s in stds], random.Random(seed))
+    model = PCAModel(k).fit(Xn)
+    mse = reconstruction_error(Xn, model.inverse_transform(model.transform(Xn)))
+    return model.gamma, mse, subspace_angles(W, model.W)
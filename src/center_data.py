@@ -1,15 +1,15 @@
+from array import array
+from operator import sub
 from src.Matrix import Matrix
 
 def center_data(X: 'Matrix') -> 'Matrix':
     if X.rows == 0 or X.cols == 0:
         return Matrix((X.rows, X.cols))
     n, m = X.rows, X.cols
-    means = [0.0] * m
-    for j in range(m):
-        col_sum = sum(X.data[i][j] for i in range(n))
-        means[j] = col_sum / n
-    X_centered = Matrix((n, m))
-    for i in range(n):
-        for j in range(m):
-            X_centered.data[i][j] = X.data[i][j] - means[j]
-    return X_centered
\ No newline at end of file
+    # Средние по столбцам (представления без копирования), затем строки
+    # центрируются по одной прямо в плоский буфер результата
+    means = [sum(X._column(j)) / n for j in range(m)]
+    out = array('d')
+    for row in X.data:
+        out.extend(map(sub, row, means))
+    return Matrix.from_buffer(out, (n, m))
@@ -1,13 +1,13 @@
 from src.Matrix import Matrix
+from src.parallel import gram_matrix
+from src.SparseMatrix import SparseMatrix
 
 def covariance_matrix(X_centered: 'Matrix') -> 'Matrix':
     if X_centered.rows == 0 or X_centered.cols == 0:
         return Matrix((X_centered.cols, X_centered.cols))
-    n, m = X_centered.rows, X_centered.cols
+    if isinstance(X_centered, SparseMatrix):
+        # Неявное центрирование (XᵀX − n·μμᵀ)/(n − 1) без уплотнения
+        return X_centered.mean_covariance()[1]
+    n = X_centered.rows
     denom = n - 1 if n > 1 else 1
-    X_T = X_centered.transpose()
-    C = X_T @ X_centered
-    for i in range(C.rows):
-        for j in range(C.cols):
-            C.data[i][j] /= denom
-    return C
\ No newline at end of file
+    return gram_matrix(X_centered, 1.0 / denom)
@@ -1,26 +1,47 @@
 from src.Matrix import Matrix
+from src.pca_stats import PCAStats
 from typing import List
 import random
 import math
 
-def find_eigenvalues(C: 'Matrix', tol: float = 1e-6) -> List[float]:
+def find_eigenvalues(C: 'Matrix', tol: float = 1e-6, stats: PCAStats = None,
+                     init_vectors: List[List[float]] = None,
+                     init_values: List[float] = None) -> List[float]:
     """
     Находит все собственные значения матрицы C методом power iteration с дефляцией.
     Возвращает список собственных значений, упорядоченных по убыванию.
+    Если передан stats, для каждого значения записываются число итераций
+    и признак сходимости.
+
+    init_vectors/init_values — тёплый старт (например, собственные пары
+    предыдущей подгонки): i-я итерация начинается с init_vectors[i] и
+    λ = init_values[i] вместо случайного вектора.
     """
+    return _power_eigenvalues(C, tol, stats, init_vectors, init_values)[0]
+
+
+def _power_eigenvalues(C, tol, stats, init_vectors, init_values):
+    """find_eigenvalues, дополнительно возвращающая сумму итераций."""
     n = C.rows
+    n_iter = 0
     # Копируем данные матрицы
     A = [[C.data[i][j] for j in range(n)] for i in range(n)]
     eigenvalues: List[float] = []
-    for _ in range(n):
-        # Случайный начальный вектор
-        b = [random.random() for _ in range(n)]
+    init_vectors = init_vectors or []
+    init_values = init_values or []
+    for idx in range(n):
+        # Начальный вектор: из тёплого старта или случайный
+        if idx < len(init_vectors):
+            b = list(init_vectors[idx])
+        else:
+            b = [random.random() for _ in range(n)]
         # Нормируем
         norm_b = math.sqrt(sum(x*x for x in b)) or 1.0
         b = [x / norm_b for x in b]
-        lambda_old = 0.0
+        lambda_old = init_values[idx] if idx < len(init_values) else 0.0
+        converged = False
         # Итерации power iteration
-        for _ in range(1000):
+        for it in range(1, 1001):
             # A @ b
             Ab = [sum(A[i][j] * b[j] for j in range(n)) for i in range(n)]
             norm_ab = math.sqrt(sum(x*x for x in Ab)) or 1.0
@@ -28,11 +49,15 @@ def find_eigenvalues(C: 'Matrix', tol: float = 1e-6) -> List[float]:
             # Rayleigh quotient
             lambda_new = sum(b[i] * sum(A[i][j] * b[j] for j in range(n)) for i in range(n))
             if abs(lambda_new - lambda_old) < tol:
+                converged = True
                 break
             lambda_old = lambda_new
+        n_iter += it
+        if stats is not None:
+            stats.record_iterations('find_eigenvalues', len(eigenvalues), it, converged)
         eigenvalues.append(lambda_new)
         # Дефляция: A = A - λ * b b^T
         for i in range(n):
             for j in range(n):
                 A[i][j] -= lambda_new * b[i] * b[j]
-    return eigenvalues
+    return eigenvalues, n_iter
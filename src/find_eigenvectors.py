@@ -2,37 +2,58 @@ from typing import List
 import random
 import math
 from src.Matrix import Matrix
+from src.pca_stats import PCAStats
 
-def find_eigenvectors(C: Matrix, eigenvalues: List[float]) -> List[Matrix]:
+def find_eigenvectors(C: Matrix, eigenvalues: List[float], stats: PCAStats = None,
+                      init_vectors: List[List[float]] = None) -> List[Matrix]:
     """
     Вход:
       C: матрица ковариаций (n×n)
       eigenvalues: список собственных значений
+      stats: PCAStats — записать число итераций и сходимость по каждому вектору
+      init_vectors: начальные векторы (тёплый старт, например столбцы W
+                    предыдущей подгонки); остальные — случайные
     Выход:
       список собственных векторов (каждый — Matrix-столбец)
     """
+    return _power_eigenvectors(C, eigenvalues, stats, init_vectors)[0]
+
+
+def _power_eigenvectors(C, eigenvalues, stats, init_vectors):
+    """find_eigenvectors, дополнительно возвращающая сумму итераций."""
     n = C.rows
+    n_iter = 0
     A = [[C.data[i][j] for j in range(n)] for i in range(n)]
     eigenvectors: List[Matrix] = []
     tol = 1e-6  # допуск для остановки power iteration
 
-    for _ in eigenvalues:
-        # случайный стартовый вектор:
-        b = [random.random() for _ in range(n)]
+    init_vectors = init_vectors or []
+    for idx, lam in enumerate(eigenvalues):
+        # стартовый вектор: из тёплого старта (вместе с λ) или случайный
+        if idx < len(init_vectors):
+            b = list(init_vectors[idx])
+            lambda_old = lam
+        else:
+            b = [random.random() for _ in range(n)]
+            lambda_old = 0.0
         norm_b = math.sqrt(sum(x*x for x in b)) or 1.0
         b = [x / norm_b for x in b]
 
-        lambda_old = 0.0
+        converged = False
         # Power iteration
-        for _ in range(1000):
+        for it in range(1, 1001):
             # умножаем A на b:
             Ab = [sum(A[i][j] * b[j] for j in range(n)) for i in range(n)]
             norm_ab = math.sqrt(sum(x*x for x in Ab)) or 1.0
             b = [x / norm_ab for x in Ab]
             lambda_new = sum(b[i] * Ab[i] for i in range(n))
             if abs(lambda_new - lambda_old) < tol:
+                converged = True
                 break
             lambda_old = lambda_new
+        n_iter += it
+        if stats is not None:
+            stats.record_iterations('find_eigenvectors', len(eigenvectors), it, converged)
 
         # сохраняем вектор-столбец в формате Matrix:
         vec = Matrix([[b[i]] for i in range(n)])
@@ -43,4 +64,4 @@ def find_eigenvectors(C: Matrix, eigenvalues: List[float]) -> List[Matrix]:
             for j in range(n):
                 A[i][j] -= lambda_old * b[i] * b[j]
 
-    return eigenvectors
+    return eigenvectors, n_iter
@@ -11,6 +11,10 @@ def gauss_solver(A: 'Matrix', b: 'Matrix') -> List['Matrix']:
     list[Matrix]: список базисных векторов решения системы
     Raises:
         ValueError: если система несовместна
+
+    Для многократного решения невырожденной системы с разными правыми
+    частями используйте LUFactorization (разложение один раз, решение
+    сразу для матрицы правых частей).
     """
     n = A.rows
     m = A.cols
@@ -18,18 +22,16 @@ def gauss_solver(A: 'Matrix', b: 'Matrix') -> List['Matrix']:
         raise ValueError("b должен быть столбцовым вектором длины n")
 
     # Формируем расширенную матрицу [A|b]
-    aug = [A.data[i][:] + [b.data[i][0]] for i in range(n)]
+    aug = [A.data[i].tolist() + [b.data[i][0]] for i in range(n)]
     EPS = 1e-9  # порог для нуля
     pivot_cols = []  # список индексов ведущих столбцов
     row = 0
 
     # Прямой ход
     for col in range(m):
-        # Поиск ненулевого ведущего элемента в текущем столбце
-        pivot = row
-        while pivot < n and abs(aug[pivot][col]) < EPS:
-            pivot += 1
-        if pivot == n:
+        # Частичный выбор: ведущий элемент — наибольший по модулю в столбце
+        pivot = max(range(row, n), key=lambda r: abs(aug[r][col]))
+        if abs(aug[pivot][col]) < EPS:
             # В этом столбце ведущего элемента нет
             continue
         # Меняем местами текущую строку и строку с найденным ведущим элементом
@@ -0,0 +1,47 @@
+from array import array
+from typing import List
+from operator import mul
+from src.Matrix import Matrix
+
+# Сколько чисел double обрабатывается за один блок строк (~256 КБ):
+# столбцы блока должны целиком помещаться в кэш.
+_BLOCK_DOUBLES = 1 << 15
+
+
+def gram_matrix(X: 'Matrix', scale: float = 1.0, block_rows: int = None,
+                means: List[float] = None) -> 'Matrix':
+    """
+    Вычисляет scale · XᵀX, не строя транспонированную копию X.
+
+    Вход:
+      X:          матрица (n×m)
+      scale:      множитель, применяемый при накоплении (например 1/(n-1))
+      means:      если задан, X центрируется на лету: (X − 1·μᵀ)ᵀ(X − 1·μᵀ)
+      block_rows: число строк в блоке; по умолчанию подбирается под кэш
+    Выход:
+      симметричная матрица (m×m)
+
+    Считается только верхний треугольник (m(m+1)/2 скалярных произведений
+    вместо m²), затем он зеркально копируется вниз.
+    """
+    n, m = X.rows, X.cols
+    if block_rows is None:
+        block_rows = max(1, _BLOCK_DOUBLES // max(m, 1))
+    # upper[i][t] хранит элемент (i, i + t)
+    upper = [[0.0] * (m - i) for i in range(m)]
+    for start in range(0, n, block_rows):
+        stop = min(n, start + block_rows)
+        if means is None:
+            cols = [X._column(j, start, stop).tolist() for j in range(m)]
+        else:
+            cols = [[v - mu for v in X._column(j, start, stop)]
+                    for j, mu in enumerate(means)]
+        for i in range(m):
+            ci = cols[i]
+            upper[i] = [acc + scale * sum(map(mul, ci, cj))
+                        for acc, cj in zip(upper[i], cols[i:])]
+    out = array('d')
+    for i in range(m):
+        out.extend([upper[j][i - j] for j in range(i)])
+        out.extend(upper[i])
+    return Matrix.from_buffer(out, (m, m))
@@ -0,0 +1,128 @@
+import math
+from operator import mul
+from typing import List
+from src.Matrix import Matrix
+from src.gram_matrix import gram_matrix
+from src.pca_model import PCAModel
+from src.project_data import project_data
+from src.symmetric_eigen import symmetric_eigen
+
+
+class IncrementalPCA:
+    """
+    PCA, обновляемый пакетами строк (partial_fit), без хранения истории.
+
+    Состояние — число объектов, средние, k главных направлений с
+    сингулярными значениями и суммы квадратов отклонений по столбцам.
+    Новый пакет объединяется с текущим подпространством через SVD матрицы
+      [ diag(s)·Vᵀ ;  X_b − μ_b ;  √(n_a·n_b/n)·(μ_a − μ_b) ]
+    размера (k + b + 1)×m, поэтому стоимость шага зависит от b и k,
+    а не от объёма истории. SVD берётся через меньшую матрицу Грама:
+    (k + b + 1)×(k + b + 1) или m×m, так что при b ≫ m шаг стоит
+    O((k + b)·m² + m³).
+
+    Атрибуты (после первого partial_fit):
+      W:           Matrix (m×k) — главные компоненты
+      means:       list[float]  — средние по колонкам
+      eigenvalues: list[float]  — объяснённые дисперсии компонент
+      gamma:       float        — доля объяснённой дисперсии
+    """
+
+    def __init__(self, k: int):
+        if k < 1:
+            raise ValueError("k должно быть не меньше 1")
+        self.k = k
+        self.n_samples = 0
+        self.means: List[float] = []
+        self.W: Matrix = None
+        self.eigenvalues: List[float] = []
+        self.gamma = 0.0
+        self._components: List[List[float]] = []
+        self._singular: List[float] = []
+        self._sq_dev: List[float] = []
+
+    def partial_fit(self, batch) -> 'IncrementalPCA':
+        """
+        Вход:
+          batch: Matrix (b×m) или последовательность строк длины m
+        """
+        block = batch if isinstance(batch, Matrix) else Matrix(batch)
+        nb, m = block.rows, block.cols
+        if nb == 0:
+            return self
+        na = self.n_samples
+        if na == 0:
+            if nb < self.k or m < self.k:
+                raise ValueError("Первый пакет должен содержать не меньше k строк и столбцов")
+            self.means = [0.0] * m
+            self._sq_dev = [0.0] * m
+        elif m != len(self.means):
+            raise ValueError("Число столбцов пакета не совпадает с обученным")
+        n = na + nb
+
+        mb = [sum(block._column(j)) / nb for j in range(m)]
+        centered = [[v - mu for v, mu in zip(row, mb)] for row in block.data]
+        # Суммы квадратов отклонений по столбцам (формула Чана) — для trace(C)
+        delta = [b - a for a, b in zip(self.means, mb)]
+        f = na * nb / n
+        sq = [0.0] * m
+        for r in centered:
+            sq = [a + t * t for a, t in zip(sq, r)]
+        self._sq_dev = [s + q + f * d * d for s, q, d in zip(self._sq_dev, sq, delta)]
+
+        rows = [[s * t for t in v] for s, v in zip(self._singular, self._components)]
+        rows += centered
+        if na > 0:
+            c = math.sqrt(f)
+            rows.append([-c * d for d in delta])
+        self.means = [a + d * nb / n for a, d in zip(self.means, delta)]
+        self.n_samples = n
+
+        # SVD rows = U·diag(s)·Vᵀ через меньшую из матриц Грама
+        k = min(self.k, len(rows), m)
+        components, singular = [], []
+        if len(rows) > m:
+            # rowsᵀ·rows = V·diag(s²)·Vᵀ (m×m): стоимость линейна по b
+            s2, V = symmetric_eigen(gram_matrix(Matrix(rows)))
+            for j in range(k):
+                components.append(V._column(j).tolist())
+                singular.append(math.sqrt(max(s2[j], 0.0)))
+        else:
+            # rows·rowsᵀ = U·diag(s²)·Uᵀ, v_j = rowsᵀ·u_j / s_j
+            G = Matrix([[sum(map(mul, ri, rj)) for rj in rows] for ri in rows])
+            s2, U = symmetric_eigen(G)
+            for j in range(k):
+                s = math.sqrt(max(s2[j], 0.0))
+                v = [0.0] * m
+                for c, r in zip(U._column(j), rows):
+                    if c != 0.0:
+                        v = [a + c * t for a, t in zip(v, r)]
+                norm = s if s > 0.0 else (math.sqrt(sum(t * t for t in v)) or 1.0)
+                components.append([t / norm for t in v])
+                singular.append(s)
+        self._components, self._singular = components, singular
+
+        denom = n - 1 if n > 1 else 1
+        self.eigenvalues = [s * s / denom for s in singular]
+        total = sum(self._sq_dev) / denom
+        self.gamma = sum(self.eigenvalues) / total if total > 0 else 0.0
+        self.W = Matrix((m, k))
+        for j, v in enumerate(components):
+            for i in range(m):
+                self.W.data[i][j] = v[i]
+        return self
+
+    def transform(self, X: 'Matrix') -> 'Matrix':
+        """Проекция (X − 1·μᵀ)·W, как X_proj у pca."""
+        if self.W is None:
+            raise ValueError("Модель ещё не обучена: вызовите partial_fit")
+        return project_data(X, self.W, self.means)
+
+    def to_model(self) -> 'PCAModel':
+        """Текущее состояние как PCAModel (inverse_transform, save/load)."""
+        if self.W is None:
+            raise ValueError("Модель ещё не обучена: вызовите partial_fit")
+        denom = self.n_samples - 1 if self.n_samples > 1 else 1
+        return PCAModel.from_components(self.W.copy(), self.means, self.eigenvalues,
+                                        self.gamma, sum(self._sq_dev) / denom,
+                                        self.n_samples)
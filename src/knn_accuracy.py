@@ -1,21 +1,18 @@
 from typing import List, Any
+from src.Matrix import Matrix
+from src.nearest_neighbors import vote
+from src.parallel import loo_neighbors
 
-def knn_accuracy(data: List[List[float]], labels: List[Any]) -> float:
+def knn_accuracy(data: List[List[float]], labels: List[Any], k: int = 1,
+                 method: str = 'auto') -> float:
     """
-    Простая 1-NN accuracy (leave-one-out).
+    Простая k-NN accuracy (leave-one-out), по умолчанию 1-NN.
+
+    data может быть списком строк или Matrix; method — 'kdtree', 'brute'
+    или 'auto' (см. loo_neighbors).
     """
-    n = len(data)
-    correct = 0
-    for i in range(n):
-        best_dist = float('inf')
-        best_label = None
-        for j in range(n):
-            if i == j:
-                continue
-            # квадрат эвклидова расстояния
-            d = sum((data[i][f] - data[j][f])**2 for f in range(len(data[0])))
-            if d < best_dist:
-                best_dist, best_label = d, labels[j]
-        if best_label == labels[i]:
-            correct += 1
-    return correct / n
\ No newline at end of file
+    rows = data.data if isinstance(data, Matrix) else data
+    n = len(rows)
+    neighbors = loo_neighbors(data, k, method)
+    correct = sum(1 for i in range(n) if vote(neighbors[i], labels) == labels[i])
+    return correct / n
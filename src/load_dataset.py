@@ -0,0 +1,29 @@
+from typing import Any, List, Tuple
+from src.Matrix import Matrix
+
+_LOADERS = {
+    'iris': 'load_iris',
+    'wine': 'load_wine',
+    'digits': 'load_digits',
+    'breast_cancer': 'load_breast_cancer',
+}
+
+
+def load_dataset(dataset_name: str) -> Tuple[Matrix, List[Any]]:
+    """
+    Загружает встроенный датасет sklearn по имени.
+
+    Вход:
+      dataset_name: 'iris', 'wine', 'digits' или 'breast_cancer'
+    Выход:
+      (X, y) — Matrix n×m признаков и список меток
+    """
+    if dataset_name not in _LOADERS:
+        raise ValueError(f"Неизвестный датасет '{dataset_name}'")
+    # sklearn импортируется только при реальной загрузке
+    import numpy
+    import sklearn.datasets
+    data = getattr(sklearn.datasets, _LOADERS[dataset_name])()
+    # Массив numpy оборачивается через буферный протокол, без списков строк
+    features = numpy.ascontiguousarray(data.data, dtype=numpy.float64)
+    return Matrix.from_buffer(features), list(data.target)
@@ -0,0 +1,186 @@
+import ast
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator, Tuple
+from src.Matrix import Matrix
+
+# Сигнатура формата .npy и размер блока строк при потоковом чтении
+_NPY_MAGIC = b'\x93NUMPY'
+_CHUNK_ROWS = 4096
+# dtype .npy, которые копируются в double (little-endian); '<f8' отображается
+# в память без копирования
+_NPY_FORMATS = {'<f4': 'f', '<i4': 'i', '<i8': 'q', '|u1': 'B', '|i1': 'b'}
+
+
+def load_npy(path: str, use_mmap: bool = True) -> Matrix:
+    """
+    Загружает двумерный массив из файла .npy.
+
+    Вход:
+      path:     путь к файлу .npy
+      use_mmap: при True и dtype '<f8' файл отображается в память
+                (только чтение) и Matrix разделяет с ним страницы
+    Выход:
+      Matrix (n×m); для fortran_order=True — с order='F'. Одномерный
+      массив читается как столбец n×1. Другие числовые dtype из
+      _NPY_FORMATS копируются в double.
+    """
+    raw = _read(path, use_mmap)
+    if bytes(raw[:6]) != _NPY_MAGIC:
+        raise ValueError(f"'{path}' не является файлом .npy")
+    major = raw[6]
+    if major == 1:
+        (hlen,), start = struct.unpack_from('<H', raw, 8), 10
+    elif major in (2, 3):
+        (hlen,), start = struct.unpack_from('<I', raw, 8), 12
+    else:
+        raise ValueError(f"Неподдерживаемая версия .npy: {major}")
+    header = ast.literal_eval(bytes(raw[start:start + hlen]).decode('latin1'))
+    descr, fortran, shape = header['descr'], header['fortran_order'], header['shape']
+    if len(shape) == 1:
+        shape = (shape[0], 1)
+    if len(shape) != 2:
+        raise ValueError(f"Ожидался двумерный массив, получена форма {shape}")
+    order = 'F' if fortran else 'C'
+    if descr != '<f8' and descr not in _NPY_FORMATS:
+        raise ValueError(f"Неподдерживаемый dtype .npy: '{descr}'")
+    fmt = 'd' if descr == '<f8' else _NPY_FORMATS[descr]
+    n, m = shape
+    size = array(fmt).itemsize * n * m
+    body = raw[start + hlen:]
+    if len(body) < size:
+        raise ValueError(f"Данные .npy занимают {len(body)} байт, для формы {n}×{m} "
+                         f"нужно {size}")
+    body = body[:size]
+    if descr == '<f8':
+        if sys.byteorder != 'little':
+            return Matrix.from_buffer(_swapped(body), shape, order)
+        return Matrix.from_buffer(body, shape, order)
+    # frombytes декодирует элементы; array(fmt, memoryview) перебирал бы байты
+    values = array(fmt)
+    values.frombytes(body)
+    if sys.byteorder != 'little' and values.itemsize > 1:
+        values.byteswap()
+    return Matrix.from_buffer(array('d', values), shape, order)
+
+
+def load_raw(path: str, cols: int, offset: int = 0, order: str = 'C',
+             use_mmap: bool = True) -> Matrix:
+    """
+    Загружает двоичный файл из little-endian double без заголовка.
+
+    Вход:
+      path:   путь к файлу
+      cols:   число столбцов m; число строк выводится из размера файла
+      offset: смещение начала данных в байтах
+      order:  'C' — в файле строки подряд, 'F' — столбцы
+    Выход:
+      Matrix (n×m), при use_mmap — только для чтения, без копирования
+    """
+    raw = _read(path, use_mmap)[offset:]
+    if cols <= 0 or len(raw) % (8 * cols):
+        raise ValueError(f"Размер данных {len(raw)} байт не кратен строке из {cols} double")
+    n = len(raw) // (8 * cols)
+    if sys.byteorder != 'little':
+        raw = _swapped(raw)
+    return Matrix.from_buffer(raw, (n, cols), order)
+
+
+def load_csv(path: str, delimiter: str = ',', skip_header: int = 0) -> Matrix:
+    """
+    Читает CSV из чисел сразу в плоский буфер double: файл отображается
+    в память и разбирается построчно, без промежуточных списков строк.
+    """
+    values = array('d')
+    n, m = 0, None
+    for row in _csv_rows(path, delimiter, skip_header):
+        before = len(values)
+        values.extend(map(float, row))
+        width = len(values) - before
+        if m is None:
+            m = width
+        elif width != m:
+            raise ValueError(f"Строка {n + 1} CSV содержит {width} значений вместо {m}")
+        n += 1
+    return Matrix.from_buffer(values, (n, m or 0))
+
+
+def iter_row_chunks(source, chunk_rows: int = _CHUNK_ROWS, delimiter: str = ',',
+                    skip_header: int = 0) -> Iterator[Matrix]:
+    """
+    Блоки строк по chunk_rows из Matrix (без копирования для order='C')
+    или из CSV-файла по пути; подходит для streaming_mean_covariance
+    и IncrementalPCA.partial_fit.
+    """
+    if isinstance(source, Matrix):
+        for start in range(0, source.rows, chunk_rows):
+            yield source.row_block(start, start + chunk_rows)
+        return
+    values, rows, m, line = array('d'), 0, None, 0
+    for row in _csv_rows(source, delimiter, skip_header):
+        before = len(values)
+        values.extend(map(float, row))
+        width = len(values) - before
+        line += 1
+        if m is None:
+            m = width
+        elif width != m:
+            raise ValueError(f"Строка {line} CSV содержит {width} значений вместо {m}")
+        rows += 1
+        if rows == chunk_rows:
+            yield Matrix.from_buffer(values, (rows, m))
+            values, rows = array('d'), 0
+    if rows:
+        yield Matrix.from_buffer(values, (rows, m))
+
+
+def create_npy(path: str, shape: Tuple[int, int]) -> Matrix:
+    """
+    Создаёт файл .npy ('<f8', C-порядок) заданной формы, заполненный
+    нулями, и возвращает отображённую в него Matrix, доступную для
+    записи: присваивания сразу попадают в файл. Подходит как out для
+    project_data и PCAModel.transform.
+    """
+    n, m = shape
+    header = f"{{'descr': '<f8', 'fortran_order': False, 'shape': ({n}, {m}), }}"
+    # Заголовок дополняется пробелами до кратности 64 байтам (формат 1.0)
+    pad = -(len(_NPY_MAGIC) + 4 + len(header) + 1) % 64
+    header = (header + ' ' * pad + '\n').encode('latin1')
+    with open(path, 'wb') as f:
+        f.write(_NPY_MAGIC + b'\x01\x00' + struct.pack('<H', len(header)) + header)
+        f.truncate(f.tell() + 8 * n * m)
+    if n * m == 0:
+        return Matrix((n, m))
+    with open(path, 'r+b') as f:
+        mm = mmap.mmap(f.fileno(), 0)
+    return Matrix.from_buffer(memoryview(mm)[len(_NPY_MAGIC) + 4 + len(header):], shape)
+
+
+def _read(path: str, use_mmap: bool) -> memoryview:
+    with open(path, 'rb') as f:
+        if use_mmap and os.fstat(f.fileno()).st_size > 0:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return memoryview(f.read())
+
+
+def _csv_rows(path: str, delimiter: str, skip_header: int) -> Iterator[list]:
+    sep = delimiter.encode()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for _ in range(skip_header):
+                mm.readline()
+            for line in iter(mm.readline, b''):
+                line = line.strip()
+                if line:
+                    yield line.split(sep)
+
+
+def _swapped(raw: memoryview) -> memoryview:
+    values = array('d', raw.cast('d'))
+    values.byteswap()
+    return memoryview(values)
@@ -0,0 +1,89 @@
+from array import array
+from typing import List
+from src.Matrix import Matrix
+
+
+class LUFactorization:
+    """
+    LU-разложение PA = LU с частичным выбором ведущего элемента.
+
+    Разложение строится один раз за O(n³), после чего solve решает систему
+    сразу для матрицы правых частей за O(n²·p), без повторного исключения.
+
+    Вход (конструктор):
+      A:   квадратная матрица коэффициентов (n×n)
+      eps: относительный порог вырожденности ведущего элемента
+    Raises:
+      ValueError: если матрица не квадратная или вырождена
+    """
+
+    def __init__(self, A: 'Matrix', eps: float = 1e-12):
+        n = A.rows
+        if A.cols != n:
+            raise ValueError("Матрица A должна быть квадратной")
+        lu = A.tolist()
+        perm = list(range(n))
+        sign = 1
+        scale = max((abs(v) for row in lu for v in row), default=0.0)
+        for col in range(n):
+            # Ведущий элемент — наибольший по модулю в столбце
+            pivot = max(range(col, n), key=lambda r: abs(lu[r][col]))
+            if abs(lu[pivot][col]) <= eps * scale:
+                raise ValueError("Матрица вырождена")
+            if pivot != col:
+                lu[col], lu[pivot] = lu[pivot], lu[col]
+                perm[col], perm[pivot] = perm[pivot], perm[col]
+                sign = -sign
+            prow = lu[col]
+            p = prow[col]
+            tail = prow[col + 1:]
+            for r in range(col + 1, n):
+                row = lu[r]
+                factor = row[col] / p
+                row[col] = factor
+                if factor != 0.0:
+                    row[col + 1:] = [a - factor * b for a, b in zip(row[col + 1:], tail)]
+        self.n = n
+        self.perm = perm
+        self.sign = sign
+        self._lu = lu
+
+    def solve(self, B: 'Matrix') -> 'Matrix':
+        """
+        Вход:
+          B: матрица правых частей (n×p), каждый столбец — отдельная система
+        Выход:
+          X: Matrix (n×p), такая что A·X = B
+        """
+        n = self.n
+        if B.rows != n:
+            raise ValueError("Число строк B должно совпадать с размером A")
+        lu = self._lu
+        # Строки решения — векторы длины p: прямой и обратный ход идут сразу
+        # по всем правым частям.
+        y: List[List[float]] = [B.data[r].tolist() for r in self.perm]
+        for i in range(n):
+            row, yi = lu[i], y[i]
+            for j in range(i):
+                l = row[j]
+                if l != 0.0:
+                    yi = [a - l * b for a, b in zip(yi, y[j])]
+            y[i] = yi
+        for i in range(n - 1, -1, -1):
+            row, yi = lu[i], y[i]
+            for j in range(i + 1, n):
+                u = row[j]
+                if u != 0.0:
+                    yi = [a - u * b for a, b in zip(yi, y[j])]
+            d = row[i]
+            y[i] = [a / d for a in yi]
+        out = array('d')
+        for yi in y:
+            out.extend(yi)
+        return Matrix.from_buffer(out, (n, B.cols))
+
+    def determinant(self) -> float:
+        det = float(self.sign)
+        for i in range(self.n):
+            det *= self._lu[i][i]
+        return det
@@ -0,0 +1,144 @@
+from typing import List, Tuple
+from operator import mul
+from src.Matrix import Matrix
+
+# Размер блока строк при проходе по X
+_CHUNK_ROWS = 4096
+
+
+class MissingMask:
+    """
+    Битовая маска пропусков матрицы n×m: бит (i, j) установлен, если
+    X[i][j] — NaN. Каждая строка занимает ceil(m/8) байт, так что маска
+    в 64 раза меньше самой матрицы.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self._stride = (cols + 7) // 8
+        self._bits = bytearray(rows * self._stride)
+        self.count = 0
+
+    def set(self, i: int, j: int):
+        pos = i * self._stride + (j >> 3)
+        bit = 1 << (j & 7)
+        if not self._bits[pos] & bit:
+            self._bits[pos] |= bit
+            self.count += 1
+
+    def is_missing(self, i: int, j: int) -> bool:
+        return bool(self._bits[i * self._stride + (j >> 3)] & (1 << (j & 7)))
+
+    def missing_in_row(self, i: int) -> List[int]:
+        """Номера столбцов с пропусками в i-й строке."""
+        start = i * self._stride
+        row = self._bits[start:start + self._stride]
+        if not any(row):
+            return []
+        return [(p << 3) + b for p, byte in enumerate(row) if byte
+                for b in range(8) if byte >> b & 1]
+
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+def masked_mean_covariance(X: 'Matrix', mode: str = 'mean'
+                           ) -> Tuple[List[float], 'Matrix', MissingMask]:
+    """
+    Средние и ковариация по наблюдённым элементам X за один проход,
+    без заполненной копии X.
+
+    Вход:
+      X:    Matrix (n×m) с возможными значениями NaN
+      mode: 'mean'     — как у handle_missing_values + covariance_matrix:
+                         пропуски считаются равными среднему столбца,
+                         делитель n − 1;
+            'pairwise' — попарное удаление: C[j][k] считается по строкам,
+                         где наблюдены оба столбца, со средними по этим
+                         строкам и делителем n_jk − 1 (C может быть
+                         не положительно полуопределённой)
+    Выход:
+      means: list[float]  — средние по наблюдённым элементам (len=m)
+      C:     Matrix (m×m) — ковариационная матрица
+      mask:  MissingMask  — положение пропусков
+
+    Для каждой пары столбцов (j ≤ k) по строкам, где наблюдены оба,
+    накапливаются n_jk, S_j|k = Σ x_j, S_k|j = Σ x_k и S_jk = Σ x_j·x_k.
+    Значения сдвигаются на первое наблюдённое значение столбца, чтобы
+    избежать потери точности при вычитании больших сумм.
+    """
+    if mode not in ('mean', 'pairwise'):
+        raise ValueError(f"Неизвестный режим пропусков '{mode}'")
+    n, m = X.rows, X.cols
+    mask = MissingMask(n, m)
+    shift: List[float] = [None] * m
+    # upper[j][t] хранит элемент (j, j + t), как в gram_matrix
+    S = [[0.0] * (m - j) for j in range(m)]
+    N = [[0.0] * (m - j) for j in range(m)]
+    A = [[0.0] * (m - j) for j in range(m)]  # Σ x_j по строкам, где есть x_k
+    B = [[0.0] * (m - j) for j in range(m)]  # Σ x_k по строкам, где есть x_j
+    for start in range(0, n, _CHUNK_ROWS):
+        stop = min(n, start + _CHUNK_ROWS)
+        size = stop - start
+        z, b, full, zsum = [], [], [], []
+        for j in range(m):
+            col = X._column(j, start, stop).tolist()
+            total = sum(col)
+            observed = None
+            if total != total:
+                # В столбце есть NaN (или ±inf, что проверится ниже)
+                observed = [v == v for v in col]
+                for i, ok in enumerate(observed):
+                    if not ok:
+                        mask.set(start + i, j)
+                if all(observed):
+                    observed = None
+            if shift[j] is None:
+                first = next((v for v in col if v == v), None)
+                shift[j] = first
+            K = shift[j] if shift[j] is not None else 0.0
+            if observed is None:
+                zj = [v - K for v in col]
+                b.append(None)
+            else:
+                zj = [v - K if ok else 0.0 for v, ok in zip(col, observed)]
+                b.append([1.0 if ok else 0.0 for ok in observed])
+            z.append(zj)
+            full.append(observed is None)
+            zsum.append(sum(zj))
+        bsum = [size if f else sum(bj) for f, bj in zip(full, b)]
+        for j in range(m):
+            zj, bj, fj = z[j], b[j], full[j]
+            S[j] = [acc + sum(map(mul, zj, zk)) for acc, zk in zip(S[j], z[j:])]
+            if fj:
+                N[j] = [acc + bk for acc, bk in zip(N[j], bsum[j:])]
+                A[j] = [acc + (zsum[j] if fk else sum(map(mul, zj, bk)))
+                        for acc, fk, bk in zip(A[j], full[j:], b[j:])]
+                B[j] = [acc + zk for acc, zk in zip(B[j], zsum[j:])]
+            else:
+                N[j] = [acc + (bsum[j] if fk else sum(map(mul, bj, bk)))
+                        for acc, fk, bk in zip(N[j], full[j:], b[j:])]
+                A[j] = [acc + (zsum[j] if fk else sum(map(mul, zj, bk)))
+                        for acc, fk, bk in zip(A[j], full[j:], b[j:])]
+                B[j] = [acc + sum(map(mul, bj, zk)) for acc, zk in zip(B[j], z[j:])]
+
+    # Сдвиг среднего относительно shift: d_j = S_j|j / n_jj
+    d = [A[j][0] / N[j][0] if N[j][0] > 0 else 0.0 for j in range(m)]
+    means = [(K if K is not None else 0.0) + dj for K, dj in zip(shift, d)]
+    C = Matrix((m, m))
+    denom = n - 1 if n > 1 else 1
+    for j in range(m):
+        for t in range(m - j):
+            k = j + t
+            njk = N[j][t]
+            if mode == 'mean':
+                # Σ (x_j − μ_j)(x_k − μ_k) по строкам, где наблюдены оба
+                c = (S[j][t] - d[k] * A[j][t] - d[j] * B[j][t] + njk * d[j] * d[k]) / denom
+            elif njk > 1:
+                c = (S[j][t] - A[j][t] * B[j][t] / njk) / (njk - 1)
+            else:
+                c = 0.0
+            C.data[j][k] = c
+            C.data[k][j] = c
+    return means, C, mask
@@ -0,0 +1,175 @@
+import heapq
+from operator import mul
+from typing import Any, List, Sequence, Tuple
+from src.Matrix import Matrix
+
+# Размер блока запросов и блока точек-кандидатов при полном переборе
+_QUERY_BLOCK = 256
+
+
+class KDTree:
+    """
+    KD-дерево для точного поиска ближайших соседей в малой размерности.
+
+    Узлы делятся по медиане вдоль признака с наибольшим разбросом; листья
+    содержат до leaf_size точек. Расстояния — квадраты евклидовых, при
+    равенстве расстояний ближе считается точка с меньшим индексом.
+    """
+
+    def __init__(self, points: Sequence[Sequence[float]], leaf_size: int = 16):
+        self.points = [list(p) for p in points]
+        self.leaf_size = max(1, leaf_size)
+        self._idx = list(range(len(self.points)))
+        # Узел: (start, end, dim, value, left, right); dim = -1 у листа
+        self._nodes: List[Tuple[int, int, int, float, int, int]] = []
+        if self.points:
+            self._build(0, len(self.points))
+
+    def _build(self, start: int, end: int) -> int:
+        node_id = len(self._nodes)
+        self._nodes.append((start, end, -1, 0.0, -1, -1))
+        if end - start <= self.leaf_size:
+            return node_id
+        pts, idx = self.points, self._idx
+        dims = len(pts[idx[start]])
+        best_dim, best_spread = 0, -1.0
+        for dim in range(dims):
+            vals = [pts[i][dim] for i in idx[start:end]]
+            spread = max(vals) - min(vals)
+            if spread > best_spread:
+                best_dim, best_spread = dim, spread
+        if best_spread <= 0.0:
+            return node_id
+        idx[start:end] = sorted(idx[start:end], key=lambda i: pts[i][best_dim])
+        mid = (start + end) // 2
+        value = pts[idx[mid]][best_dim]
+        left = self._build(start, mid)
+        right = self._build(mid, end)
+        self._nodes[node_id] = (start, end, best_dim, value, left, right)
+        return node_id
+
+    def query(self, x: Sequence[float], k: int = 1, exclude: int = None) -> List[Tuple[float, int]]:
+        """
+        Вход:
+          x:       точка-запрос
+          k:       число соседей
+          exclude: индекс точки, которую нужно пропустить (leave-one-out)
+        Выход:
+          список (квадрат расстояния, индекс) по возрастанию
+        """
+        x = list(x)
+        heap: List[Tuple[float, int]] = []  # (−d, −j): на вершине худший сосед
+        pts, idx, nodes = self.points, self._idx, self._nodes
+
+        def search(node_id: int):
+            start, end, dim, value, left, right = nodes[node_id]
+            if dim < 0:
+                for j in idx[start:end]:
+                    if j == exclude:
+                        continue
+                    d = sum((a - b) ** 2 for a, b in zip(x, pts[j]))
+                    item = (-d, -j)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+                return
+            diff = x[dim] - value
+            near, far = (left, right) if diff <= 0 else (right, left)
+            search(near)
+            if len(heap) < k or diff * diff <= -heap[0][0]:
+                search(far)
+
+        if nodes:
+            search(0)
+        return sorted((-d, -j) for d, j in heap)
+
+
+def brute_force_neighbors(points, k: int = 1, start: int = 0,
+                          stop: int = None) -> List[List[Tuple[float, int]]]:
+    """
+    Leave-one-out соседи для точек [start, stop) полным перебором плитками
+    через разложение ‖a − b‖² = ‖a‖² + ‖b‖² − 2·a·b: для блока из
+    _QUERY_BLOCK запросов и блока из _QUERY_BLOCK точек скалярные
+    произведения считаются одним умножением Matrix.
+
+    points — Matrix (строки читаются через row_block без копирования)
+    или последовательность точек. Кандидаты, близкие к k-й границе,
+    пересчитываются точно, поэтому результат (включая разрешение равенств
+    по индексу) совпадает с прямым вычислением Σ(a − b)².
+    """
+    P = points if isinstance(points, Matrix) else Matrix(points)
+    n = P.rows
+    stop = n if stop is None else min(stop, n)
+    result: List[List[Tuple[float, int]]] = []
+    if start >= stop:
+        return result
+    rows = P.data
+    norms = [sum(map(mul, p, p)) for p in rows]
+    max_norm = max(norms, default=0.0)
+    for block_start in range(start, stop, _QUERY_BLOCK):
+        Q = P.row_block(block_start, min(stop, block_start + _QUERY_BLOCK))
+        dots: List[List[float]] = [[] for _ in range(Q.rows)]
+        for t in range(0, n, _QUERY_BLOCK):
+            for acc, tile in zip(dots, (Q @ _transposed_rows(P, t, t + _QUERY_BLOCK)).data):
+                acc.extend(tile)
+        for i, row_dots in zip(range(block_start, block_start + Q.rows), dots):
+            qi, ni = rows[i], norms[i]
+            approx = [(ni + nj - 2.0 * d, j)
+                      for j, (nj, d) in enumerate(zip(norms, row_dots)) if j != i]
+            if not approx:
+                result.append([])
+                continue
+            kth = heapq.nsmallest(k, approx)[-1][0]
+            tol = 1e-9 * (ni + max_norm) + 1e-300
+            candidates = [j for d, j in approx if d <= kth + tol]
+            exact = sorted((sum((a - b) ** 2 for a, b in zip(qi, rows[j])), j) for j in candidates)
+            result.append(exact[:k])
+    return result
+
+
+def _transposed_rows(P: Matrix, start: int, stop: int) -> Matrix:
+    """Транспонированный блок строк [start, stop) — представление того же буфера."""
+    block = P.row_block(start, stop)
+    if block.rows == 0 or block.cols == 0:
+        return Matrix((block.cols, block.rows))
+    return Matrix.from_buffer(block._values(), (block.cols, block.rows), order='F')
+
+
+def loo_neighbors(points: Sequence[Sequence[float]], k: int = 1,
+                  method: str = 'auto') -> List[List[Tuple[float, int]]]:
+    """
+    Leave-one-out k ближайших соседей каждой точки.
+
+    Вход:
+      points: Matrix или последовательность точек (списки)
+      k:      число соседей
+      method: 'kdtree', 'brute' или 'auto' (KD-дерево при размерности ≤ 10)
+    Выход:
+      для каждой точки — список (квадрат расстояния, индекс) по возрастанию
+
+    Matrix передаётся полному перебору как есть; KD-дерево хранит свою
+    копию точек.
+    """
+    rows = points.data if isinstance(points, Matrix) else points
+    if method == 'auto':
+        dim = len(rows[0]) if len(rows) else 0
+        method = 'kdtree' if dim <= 10 and len(rows) > 64 else 'brute'
+    if method == 'kdtree':
+        tree = KDTree(rows)
+        return [tree.query(p, k, exclude=i) for i, p in enumerate(tree.points)]
+    if method == 'brute':
+        return brute_force_neighbors(points, k)
+    raise ValueError(f"Неизвестный метод поиска соседей '{method}'")
+
+
+def vote(neighbors: List[Tuple[float, int]], labels: Sequence[Any]) -> Any:
+    """Метка большинства среди соседей; при равенстве — метка ближайшего."""
+    counts = {}
+    for rank, (_, j) in enumerate(neighbors):
+        lbl = labels[j]
+        cnt, first = counts.get(lbl, (0, rank))
+        counts[lbl] = (cnt + 1, first)
+    if not counts:
+        return None
+    return min(counts.items(), key=lambda item: (-item[1][0], item[1][1]))[0]
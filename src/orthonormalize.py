@@ -0,0 +1,37 @@
+import math
+import random
+from operator import mul
+from typing import List
+
+
+def orthonormalize_columns(cols: List[List[float]], rng: random.Random = None) -> List[List[float]]:
+    """
+    Ортонормирует набор векторов модифицированным методом Грама–Шмидта
+    с повторной ортогонализацией (QR без R).
+
+    Вход:
+      cols: список векторов одинаковой длины (столбцы матрицы)
+      rng:  генератор для замены линейно зависимых векторов случайными
+    Выход:
+      список ортонормированных векторов того же размера
+    """
+    basis: List[List[float]] = []
+    for col in cols:
+        v = list(col)
+        norm0 = math.sqrt(sum(map(mul, v, v)))
+        for attempt in range(3):
+            # Два прохода Грама–Шмидта дают ортогональность до машинной точности
+            for _ in range(2):
+                for q in basis:
+                    c = sum(map(mul, q, v))
+                    if c != 0.0:
+                        v = [a - c * b for a, b in zip(v, q)]
+            norm = math.sqrt(sum(map(mul, v, v)))
+            if norm > 1e-10 * norm0 and norm > 0.0:
+                break
+            if rng is None:
+                rng = random.Random(len(basis))
+            v = [rng.gauss(0.0, 1.0) for _ in v]
+            norm0 = math.sqrt(sum(map(mul, v, v)))
+        basis.append([a / norm for a in v])
+    return basis
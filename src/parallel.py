@@ -0,0 +1,228 @@
+import atexit
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, List, Sequence, Tuple
+from src.Matrix import Matrix
+
+# Минимальный объём работы (число умножений), с которого выгоден пул:
+# меньшие задачи считаются в текущем процессе
+_MIN_WORK = 1 << 22
+
+_num_workers = 1
+_owner_pid = os.getpid()
+_pool: ProcessPoolExecutor = None
+
+
+def set_num_workers(n: int = None):
+    """
+    Задаёт число процессов для параллельных ядер: 1 — всё считается
+    последовательно (по умолчанию), None — по числу ядер.
+    """
+    global _num_workers, _owner_pid
+    if n is None:
+        n = os.cpu_count() or 1
+    if n < 1:
+        raise ValueError("Число процессов должно быть не меньше 1")
+    _shutdown()
+    _num_workers = n
+    _owner_pid = os.getpid()
+
+
+def get_num_workers() -> int:
+    """Текущее число процессов; в дочерних процессах всегда 1."""
+    return _num_workers if os.getpid() == _owner_pid else 1
+
+
+def should_parallelize(work: int, rows: int) -> bool:
+    """Стоит ли распределять задачу из work умножений по rows строкам."""
+    return get_num_workers() > 1 and rows > 1 and work >= _MIN_WORK
+
+
+def matmul(A: Matrix, B: Matrix) -> Matrix:
+    """A @ B: блоки строк A умножаются на B в разных процессах."""
+    if not should_parallelize(A.rows * A.cols * B.cols, A.rows):
+        return A @ B
+    with _Shared(A) as sa, _Shared(B) as sb:
+        parts = _partition(A.rows, get_num_workers())
+        blocks = _map(_matmul_task, [(sa.spec, sb.spec, start, stop) for start, stop in parts])
+    out = array('d')
+    for block in blocks:
+        out.extend(block)
+    return Matrix.from_buffer(out, (A.rows, B.cols))
+
+
+def gram_matrix(X: Matrix, scale: float = 1.0) -> Matrix:
+    """scale · XᵀX: частичные суммы по блокам строк складываются по порядку блоков."""
+    from src.gram_matrix import gram_matrix as serial_gram
+    n, m = X.rows, X.cols
+    if not should_parallelize(n * m * m // 2, n):
+        return serial_gram(X, scale)
+    with _Shared(X) as sx:
+        parts = _partition(n, get_num_workers())
+        blocks = _map(_gram_task, [(sx.spec, start, stop, scale) for start, stop in parts])
+    total = blocks[0]
+    for block in blocks[1:]:
+        total = array('d', map(float.__add__, total, block))
+    return Matrix.from_buffer(total, (m, m))
+
+
+def mean_covariance(X: Matrix, chunk_rows: int = 4096) -> Tuple[List[float], Matrix]:
+    """
+    Средние и ковариация, как у streaming_mean_covariance: каждый процесс
+    накапливает StreamingCovariance по своим строкам, состояния сливаются
+    по формулам Чана в порядке блоков — результат не зависит от того,
+    какой процесс закончил первым.
+    """
+    from src.streaming_covariance import StreamingCovariance, streaming_mean_covariance
+    n, m = X.rows, X.cols
+    if not should_parallelize(n * m * m // 2, n):
+        return streaming_mean_covariance(
+            X.row_block(start, start + chunk_rows) for start in range(0, n, chunk_rows))
+    with _Shared(X) as sx:
+        parts = _partition(n, get_num_workers())
+        states = _map(_covariance_task, [(sx.spec, start, stop, chunk_rows)
+                                          for start, stop in parts])
+    acc = StreamingCovariance()
+    for count, means, comoment in states:
+        if count:
+            acc._merge(count, means, Matrix.from_buffer(comoment, (m, m)))
+    if acc.count == 0:
+        raise ValueError("Пустой поток данных")
+    return acc.means, acc.covariance()
+
+
+def loo_neighbors(points, k: int = 1, method: str = 'auto') -> List[List[Tuple[float, int]]]:
+    """
+    Параллельный вариант nearest_neighbors.loo_neighbors: точки-запросы
+    делятся на блоки, результаты собираются в исходном порядке и
+    совпадают с последовательными. Для 'kdtree' каждый процесс строит
+    своё дерево один раз, поэтому блоков столько же, сколько процессов.
+    """
+    from src.nearest_neighbors import loo_neighbors as serial_loo
+    rows = points.data if isinstance(points, Matrix) else points
+    n = len(rows)
+    dim = len(rows[0]) if n else 0
+    if method == 'auto':
+        method = 'kdtree' if dim <= 10 and n > 64 else 'brute'
+    if method not in ('kdtree', 'brute'):
+        raise ValueError(f"Неизвестный метод поиска соседей '{method}'")
+    work = n * dim * (n if method == 'brute' else 64)
+    if not should_parallelize(work, n):
+        return serial_loo(points, k, method)
+    X = points if isinstance(points, Matrix) else Matrix(points)
+    with _Shared(X) as sx:
+        parts = _partition(n, get_num_workers())
+        blocks = _map(_neighbors_task, [(sx.spec, start, stop, k, method)
+                                         for start, stop in parts])
+    return [row for block in blocks for row in block]
+
+
+# --- общая память и пул -------------------------------------------------
+
+class _Shared:
+    """Копия матрицы (по строкам) в разделяемой памяти на время with."""
+
+    def __init__(self, X: Matrix):
+        self.X = X
+
+    def __enter__(self) -> '_Shared':
+        X = self.X
+        self.shm = shared_memory.SharedMemory(create=True, size=max(8, 8 * X.rows * X.cols))
+        view = self.shm.buf.cast('d')
+        if X.rows and X.cols:
+            view[:X.rows * X.cols] = array('d', X._values())
+        view.release()
+        self.spec = (self.shm.name, X.rows, X.cols)
+        return self
+
+    def __exit__(self, *exc):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _attach(spec) -> Tuple[shared_memory.SharedMemory, Matrix]:
+    name, rows, cols = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, Matrix.from_buffer(shm.buf[:8 * rows * cols], (rows, cols))
+
+
+def _partition(n: int, parts: int) -> List[Tuple[int, int]]:
+    """Не больше parts непрерывных диапазонов строк почти равной длины."""
+    parts = max(1, min(parts, n))
+    size, extra = divmod(n, parts)
+    bounds, start = [], 0
+    for p in range(parts):
+        stop = start + size + (1 if p < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _map(fn, tasks: Sequence[tuple]) -> List[Any]:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=_num_workers)
+    return list(_pool.map(fn, *zip(*tasks)))
+
+
+def _shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+atexit.register(_shutdown)
+
+
+# --- задачи процессов-исполнителей ---------------------------------------
+# Представления Matrix над общей памятью освобождаются до shm.close().
+
+def _matmul_task(spec_a, spec_b, start: int, stop: int) -> array:
+    sa, A = _attach(spec_a)
+    sb, B = _attach(spec_b)
+    try:
+        return array('d', (A.row_block(start, stop) @ B)._values())
+    finally:
+        del A, B
+        sa.close()
+        sb.close()
+
+
+def _gram_task(spec, start: int, stop: int, scale: float) -> array:
+    from src.gram_matrix import gram_matrix as serial_gram
+    shm, X = _attach(spec)
+    try:
+        return array('d', serial_gram(X.row_block(start, stop), scale)._values())
+    finally:
+        del X
+        shm.close()
+
+
+def _covariance_task(spec, start: int, stop: int, chunk_rows: int):
+    from src.streaming_covariance import StreamingCovariance
+    shm, X = _attach(spec)
+    try:
+        acc = StreamingCovariance()
+        for s in range(start, stop, chunk_rows):
+            acc.update(X.row_block(s, min(stop, s + chunk_rows)))
+        comoment = array('d', acc.comoment._values()) if acc.count else array('d')
+        return acc.count, list(acc.means), comoment
+    finally:
+        del X
+        shm.close()
+
+
+def _neighbors_task(spec, start: int, stop: int, k: int, method: str):
+    from src.nearest_neighbors import KDTree, brute_force_neighbors
+    shm, X = _attach(spec)
+    try:
+        if method != 'kdtree':
+            return brute_force_neighbors(X, k, start, stop)
+        tree = KDTree(X.data)
+    finally:
+        del X
+        shm.close()
+    return [tree.query(tree.points[i], k, exclude=i) for i in range(start, stop)]
@@ -1,66 +1,218 @@
-from src.covariance_matrix import covariance_matrix
-from src.find_eigenvalues import find_eigenvalues
+import math
+from src import parallel
+from src.missing_values import masked_mean_covariance
+from src.find_eigenvalues import _power_eigenvalues
 from src.explained_variance_ratio import explained_variance_ratio
-from src.find_eigenvectors import find_eigenvectors
+from src.find_eigenvectors import _power_eigenvectors
 from src.auto_select_k import auto_select_k
+from src.symmetric_eigen import symmetric_eigen
+from src.top_k_eigen import _top_k_eigen
+from src.project_data import project_data
+from src.randomized_pca import randomized_fit
+from src.pca_cache import PCACache, cached
+from src.pca_stats import PCAStats, stage
 from src.Matrix import Matrix
+from src.SparseMatrix import SparseMatrix
 
+# Размер блока строк при потоковом проходе по X
+_CHUNK_ROWS = 4096
 
-def pca(X: Matrix, k: int = None, threshold: float = 0.95):
+
+def pca(X: Matrix, k: int = None, threshold: float = 0.95, solver: str = 'auto',
+        seed: int = None, oversampling: int = 10, cache: PCACache = None,
+        stats: PCAStats = None, missing: str = None, out: Matrix = None,
+        warm_start=None):
     """
     Полный алгоритм PCA с опциональным авто-подбором числа компонент.
 
     Вход:
-      X:       Matrix (n×m) — исходные данные
+      X:       Matrix или SparseMatrix (n×m) — исходные данные
       k:       int или None — желаемое число компонент
       threshold: float — если k=None, то используется этот порог
                         для auto_select_k(eigenvalues, threshold)
+      solver:  'eigh' — symmetric_eigen (все пары за один вызов),
+               'subspace' — top_k_eigen (только k старших пар; при k=None
+                            k растёт до порога threshold от trace(C)),
+               'power' — find_eigenvalues + find_eigenvectors,
+               'randomized' — randomized_pca (рандомизированный SVD без
+                              построения C, нужно задать k),
+               'auto' — 'subspace' при k ≪ m, иначе 'eigh'
+      seed, oversampling: параметры solver='randomized'
+      cache:   PCACache — переиспользовать средние, C и собственные пары
+               для тех же данных и настроек
+      stats:   PCAStats — время этапов, итерации и невязки собственных
+               пар (без stats никаких замеров не делается)
+      missing: None — X без пропусков; 'mean' или 'pairwise' — X может
+               содержать NaN, средние и C считаются по наблюдённым
+               элементам (см. masked_mean_covariance), а при проекции
+               пропуски равны среднему столбца. Заполненная копия X
+               не создаётся.
+      out:     Matrix (n×k) — куда записать проекцию (например, файл из
+               create_npy); k должно быть известно заранее
+      warm_start: PCAModel или пара (W, eigenvalues) предыдущей подгонки —
+               начальное подпространство для 'subspace' и 'power'
+               ('auto' при этом выбирает 'subspace'). Для данных, мало
+               изменившихся с прошлой подгонки (скользящее окно), решателю
+               хватает нескольких итераций. stats.n_iter — число итераций,
+               stats.iterations_saved — экономия относительно warm_start.n_iter
     Выход:
       X_proj: Matrix (n×k) — проекция данных
       gamma:  float        — доля объяснённой дисперсии
       W:      Matrix (m×k) — матрица главных компонент
       means:  list[float]  — вектор средних по колонкам (len=m)
     """
+    W, means, _, gamma, _, mask, _ = _fit(X, k, threshold, solver, seed, oversampling,
+                                          cache, stats, missing, warm_start)
+    with stage(stats, 'projection'):
+        X_proj = project_data(X, W, means, mask, out)
+    return X_proj, gamma, W, means
+
+
+def fit_pca(X: Matrix, k: int = None, threshold: float = 0.95, solver: str = 'auto',
+            seed: int = None, oversampling: int = 10, cache: PCACache = None,
+            stats: PCAStats = None, missing: str = None, warm_start=None):
+    """
+    Обучающая часть pca без проекции данных. Параметры — как у pca.
+
+    Выход:
+      W:              Matrix (m×k) — матрица главных компонент
+      means:          list[float]  — вектор средних по колонкам (len=m)
+      eigenvalues:    list[float]  — найденные собственные значения по убыванию
+                                     (весь спектр или только старшие)
+      gamma:          float        — доля объяснённой дисперсии
+      total_variance: float        — trace(C), полная дисперсия
+    """
+    return _fit(X, k, threshold, solver, seed, oversampling, cache, stats, missing,
+                warm_start)[:5]
+
+
+def _fit(X, k, threshold, solver, seed, oversampling, cache, stats, missing, warm_start):
+    """
+    fit_pca, дополнительно возвращающая маску пропусков (или None) и число
+    итераций решателя (0 для прямых решателей и при попадании в кэш).
+    """
     n, m = X.rows, X.cols
     if n == 0 or m == 0:
         raise ValueError("Пустая матрица X")
+    fp = cache.fingerprint(X) if cache is not None else None
+    if missing is not None and (solver == 'randomized' or isinstance(X, SparseMatrix)):
+        raise ValueError("missing поддерживается только для плотной X и solver без 'randomized'")
+    if solver == 'randomized':
+        with stage(stats, 'randomized_fit'):
+            W, means, eigenvalues, gamma, total = cached(
+                cache, (fp, solver, k, oversampling, seed),
+                lambda: randomized_fit(X, k, oversampling=oversampling, seed=seed))
+        return W.copy(), list(means), list(eigenvalues), gamma, total, None, 0
+
+    # 1-2) Средние и ковариационная матрица за один проход по блокам строк,
+    #      без центрированной копии X
+    mask = None
+    with stage(stats, 'mean_covariance'):
+        if missing is not None:
+            means, C, mask = cached(cache, (fp, 'stats', missing),
+                                    lambda: masked_mean_covariance(X, missing))
+        elif isinstance(X, SparseMatrix):
+            means, C = cached(cache, (fp, 'stats'), X.mean_covariance)
+        else:
+            # Блоки строк распределяются по процессам (см. parallel.set_num_workers)
+            means, C = cached(cache, (fp, 'stats'),
+                              lambda: parallel.mean_covariance(X, _CHUNK_ROWS))
+    means = list(means)
 
-    # 1) Вычисляем средние и центрируем
-    means = [sum(X.data[i][j] for i in range(n)) / n for j in range(m)]
-    X_centered = Matrix([[X.data[i][j] - means[j] for j in range(m)]
-                         for i in range(n)])
+    # 3) Собственные значения и векторы (пары упорядочены по убыванию λ)
+    if solver == 'auto':
+        if warm_start is not None:
+            solver = 'subspace'
+        else:
+            solver = 'subspace' if k is not None and 4 * (k + 5) <= m else 'eigh'
+    init, init_values = _warm_start_pairs(warm_start)
+    # Итерационный решатель отдаёт число итераций третьим элементом; в кэш
+    # попадает только пара (λ, V)
+    n_iter = 0
 
-    # 2) Ковариационная матрица
-    C = covariance_matrix(X_centered)
+    def counted(result):
+        nonlocal n_iter
+        *pairs, n_iter = result
+        return pairs
 
-    # 3) Собственные значения и векторы
-    eigenvalues = find_eigenvalues(C)
+    # Ключи собственных пар включают missing: от него зависит сама C
+    with stage(stats, 'eigen'):
+        if solver == 'subspace':
+            key = (fp, solver, missing, k, threshold if k is None else None)
+            eigenvalues, V = cached(cache, key, lambda: counted(_top_k_eigen(
+                C, k, threshold, 1e-8, 1000, None, stats, init)))
+            k = len(eigenvalues) if k is None else k
+        elif solver == 'eigh':
+            eigenvalues, V = cached(cache, (fp, solver, missing),
+                                    lambda: symmetric_eigen(C, stats=stats))
+        elif solver == 'power':
+            eigenvalues, V = cached(cache, (fp, solver, missing),
+                                    lambda: counted(_power_eigenpairs(C, stats, init,
+                                                                      init_values)))
+        else:
+            raise ValueError(f"Неизвестный solver '{solver}'")
+    if stats is not None:
+        stats.n_iter = n_iter
+        stats.iterations_saved = _iterations_saved(warm_start, n_iter)
+    eigenvalues = list(eigenvalues)
     if not eigenvalues:
         raise ValueError("Не удалось найти собственные значения")
     if k is None:
         k = auto_select_k(eigenvalues, threshold)
     if not (1 <= k <= m):
         raise ValueError(f"k должно быть в диапазоне [1, {m}], получено {k}")
+    if V.cols < k:
+        raise ValueError(f"Найдено лишь {V.cols} векторов, запрошено {k}")
 
-    eigenvectors = find_eigenvectors(C, eigenvalues)
-    if len(eigenvectors) < k:
-        raise ValueError(f"Найдено лишь {len(eigenvectors)} векторов, запрошено {k}")
+    # 4) W — первые k собственных векторов
+    W = Matrix((m, k))
+    for i in range(m):
+        W.data[i][:] = V.data[i][:k]
+    if stats is not None:
+        CW = C @ W
+        stats.residuals = [
+            math.sqrt(sum((CW.data[i][j] - eigenvalues[j] * W.data[i][j]) ** 2 for i in range(m)))
+            for j in range(k)]
 
-    # 4) Сортируем пары (λ, v) и отбираем топ-k
-    pairs = list(zip(eigenvalues, eigenvectors))
-    pairs.sort(key=lambda x: x[0], reverse=True)
-    top_vals, top_vecs = zip(*pairs[:k])
+    # 5) Доля объяснённой дисперсии (для частичного спектра — от trace(C))
+    total = sum(C.data[i][i] for i in range(m))
+    if solver == 'subspace':
+        gamma = sum(eigenvalues[:k]) / total if total > 0 else 0.0
+    else:
+        gamma = explained_variance_ratio(eigenvalues, k)
 
-    # 5) Формируем W и проекцию
-    W = Matrix((m, k))
-    for j, vec in enumerate(top_vecs):
+    return W, means, eigenvalues, gamma, total, mask, n_iter
+
+
+def _power_eigenpairs(C: Matrix, stats: PCAStats = None, init: Matrix = None,
+                      init_values: list = None):
+    """
+    Собственные пары степенным методом, упорядоченные по убыванию λ,
+    и суммарное число итераций.
+    """
+    vectors = [init._column(j).tolist() for j in range(init.cols)] if init is not None else None
+    eigenvalues, it_values = _power_eigenvalues(C, 1e-6, stats, vectors, init_values)
+    eigenvectors, it_vectors = _power_eigenvectors(C, eigenvalues, stats, vectors)
+    pairs = sorted(zip(eigenvalues, eigenvectors), key=lambda x: x[0], reverse=True)
+    m = C.rows
+    V = Matrix((m, len(pairs)))
+    for j, (_, vec) in enumerate(pairs):
         for i in range(m):
-            W.data[i][j] = vec.data[i][0]
+            V.data[i][j] = vec.data[i][0]
+    return [lam for lam, _ in pairs], V, it_values + it_vectors
 
-    X_proj = X_centered @ W
 
-    # 6) Доля объяснённой дисперсии
-    gamma = explained_variance_ratio(eigenvalues, k)
+def _iterations_saved(warm_start, n_iter: int):
+    """Экономия итераций относительно warm_start.n_iter (None, если он неизвестен)."""
+    previous = getattr(warm_start, 'n_iter', 0)
+    return previous - n_iter if previous else None
 
-    return X_proj, gamma, W, means
 
+def _warm_start_pairs(warm_start):
+    """(W, eigenvalues) из PCAModel или пары; (None, None) без тёплого старта."""
+    if warm_start is None:
+        return None, None
+    if hasattr(warm_start, 'W'):
+        return warm_start.W, list(warm_start.eigenvalues)
+    W, eigenvalues = warm_start
+    return W, list(eigenvalues)
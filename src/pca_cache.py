@@ -0,0 +1,117 @@
+import hashlib
+import os
+import pickle
+import struct
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+from src.Matrix import Matrix
+from src.SparseMatrix import SparseMatrix
+
+
+class PCACache:
+    """
+    Кэш промежуточных результатов PCA (средние, ковариация, собственные
+    пары), адресуемый по содержимому матрицы.
+
+    Ключ — отпечаток данных (blake2b по буферу Matrix и её форме) плюс
+    настройки решателя, поэтому повторные fit на тех же данных (перебор k,
+    перебор порога auto_select_k) не повторяют O(n·m² + m³) работу.
+    Память ограничена max_bytes с вытеснением LRU; если задан directory,
+    записи дополнительно сохраняются на диск и переживают перезапуск.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, directory: str = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._sizes = {}
+        self._used = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(X: 'Matrix') -> str:
+        """Быстрый отпечаток содержимого матрицы (хеш сырого буфера)."""
+        h = hashlib.blake2b(digest_size=16)
+        if isinstance(X, SparseMatrix):
+            h.update(struct.pack('<QQc', X.rows, X.cols, b'S'))
+            for buf in (X.indptr, X.indices, X.data):
+                h.update(buf)
+            return h.hexdigest()
+        h.update(struct.pack('<QQc', X.rows, X.cols, X.order.encode()))
+        if X.rows and X.cols:
+            h.update(X._view)
+        return h.hexdigest()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Возвращает значение по ключу, при промахе вычисляет и сохраняет его."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        value = self._load(key)
+        if value is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = compute()
+            self._dump(key, value)
+        self._store(key, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self._used = 0
+
+    def _store(self, key: Hashable, value: Any):
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = value
+        self._sizes[key] = size
+        self._used += size
+        while self._used > self.max_bytes:
+            old, _ = self._entries.popitem(last=False)
+            self._used -= self._sizes.pop(old)
+
+    def _path(self, key: Hashable) -> str:
+        name = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + '.pkl')
+
+    def _load(self, key: Hashable):
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            stored_key, value = pickle.load(f)
+        return value if stored_key == key else None
+
+    def _dump(self, key: Hashable, value: Any):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+
+def cached(cache: PCACache, key: Hashable, compute: Callable[[], Any]) -> Any:
+    """compute() через кэш, если он задан, иначе напрямую."""
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(key, compute)
+
+
+def _nbytes(value: Any) -> int:
+    """Оценка объёма значения в байтах (Matrix и списки чисел — по 8 байт)."""
+    if isinstance(value, Matrix):
+        return 8 * value.rows * value.cols
+    if isinstance(value, (list, tuple)):
+        return 8 + sum(_nbytes(v) for v in value)
+    return 8
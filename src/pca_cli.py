@@ -0,0 +1,126 @@
+"""
+Командная строка для обученных моделей PCA.
+
+Запуск из корня репозитория:
+  python -m src.pca_cli fit data.csv -k 5 -o model.pcam
+  python -m src.pca_cli project model.pcam < rows.csv > proj.csv
+  python -m src.pca_cli score model.pcam rows.npy --batch 10000
+
+fit обучает PCAModel на файле (.npy, .csv) и сохраняет её. project
+и score загружают модель один раз (W отображается в память) и читают
+строки из файла или stdin блоками по --batch строк: в памяти находится
+не больше одного блока входа и выхода. project выводит проекции строк,
+score — ошибку восстановления каждой строки (reconstruction_scores).
+"""
+import argparse
+import os
+import sys
+from array import array
+from typing import IO, Iterator, List
+
+from src.Matrix import Matrix
+from src.load_matrix import iter_row_chunks, load_csv, load_npy
+from src.pca_model import PCAModel
+from src.reconstruction_scores import iter_reconstruction_scores
+
+DEFAULT_BATCH = 4096
+
+
+def read_batches(stream: IO[str], batch: int, delimiter: str = ',',
+                 skip_header: int = 0) -> Iterator[Matrix]:
+    """Блоки по batch строк из текстового потока с числами через delimiter."""
+    for _ in range(skip_header):
+        stream.readline()
+    values, rows, m = array('d'), 0, None
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        before = len(values)
+        values.extend(map(float, line.split(delimiter)))
+        width = len(values) - before
+        if m is None:
+            m = width
+        elif width != m:
+            raise ValueError(f"Строка содержит {width} значений вместо {m}")
+        rows += 1
+        if rows == batch:
+            yield Matrix.from_buffer(values, (rows, m))
+            values, rows = array('d'), 0
+    if rows:
+        yield Matrix.from_buffer(values, (rows, m))
+
+
+def input_batches(path: str, batch: int, delimiter: str = ',',
+                  skip_header: int = 0) -> Iterator[Matrix]:
+    """Блоки строк из stdin ('-'), .npy (через mmap) или CSV-файла."""
+    if path == '-':
+        return read_batches(sys.stdin, batch, delimiter, skip_header)
+    if path.endswith('.npy'):
+        return iter_row_chunks(load_npy(path), batch)
+    return iter_row_chunks(path, batch, delimiter, skip_header)
+
+
+def write_rows(out: IO[str], rows, delimiter: str = ','):
+    out.write(''.join(delimiter.join(map(repr, row)) + '\n' for row in rows))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Обучение и применение моделей PCA")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    fit = sub.add_parser("fit", help="обучить модель и сохранить её")
+    fit.add_argument("data", help="файл .npy или .csv")
+    fit.add_argument("-o", "--output", required=True, help="куда сохранить модель")
+    fit.add_argument("-k", type=int, default=None, help="число компонент")
+    fit.add_argument("--threshold", type=float, default=0.95,
+                     help="порог объяснённой дисперсии при k не заданном")
+    fit.add_argument("--solver", default="auto")
+
+    for name, text in (("project", "спроецировать строки"),
+                       ("score", "ошибка восстановления каждой строки")):
+        cmd = sub.add_parser(name, help=text)
+        cmd.add_argument("model", help="файл модели (PCAModel.save)")
+        cmd.add_argument("input", nargs="?", default="-",
+                         help="файл .npy или .csv; по умолчанию stdin")
+        cmd.add_argument("--batch", type=int, default=DEFAULT_BATCH,
+                         help="число строк в блоке")
+
+    for cmd in sub.choices.values():
+        cmd.add_argument("--delimiter", default=",")
+        cmd.add_argument("--skip-header", type=int, default=0,
+                         help="сколько первых строк CSV пропустить")
+    args = parser.parse_args(argv)
+
+    if args.command == "fit":
+        if args.data.endswith('.npy'):
+            X = load_npy(args.data)
+        else:
+            X = load_csv(args.data, args.delimiter, args.skip_header)
+        model = PCAModel(args.k, args.threshold, args.solver).fit(X)
+        model.save(args.output)
+        print(f"k={model.k} gamma={model.gamma:.6f}", file=sys.stderr)
+        return 0
+
+    if args.batch < 1:
+        parser.error("--batch должно быть не меньше 1")
+    model = PCAModel.load(args.model)
+    chunks = input_batches(args.input, args.batch, args.delimiter, args.skip_header)
+    out = sys.stdout
+    try:
+        if args.command == "project":
+            for block in chunks:
+                write_rows(out, model.transform(block).data, args.delimiter)
+        else:
+            for scores in iter_reconstruction_scores(chunks, model.W, model.means):
+                out.write(''.join(repr(s) + '\n' for s in scores))
+        out.flush()
+    except BrokenPipeError:
+        # Читатель закрыл канал (например, head): выходим без трассировки
+        os.dup2(os.open(os.devnull, os.O_WRONLY), out.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+import mmap
+import struct
+import sys
+from array import array
+from operator import mul
+from typing import List
+from src.Matrix import Matrix
+from src.pca import _fit, _iterations_saved
+from src.pca_cache import PCACache
+from src.pca_stats import PCAStats
+from src.project_data import project_data
+from src.reconstruction_scores import expected_reconstruction_mse, reconstruction_scores
+
+# Заголовок файла модели: сигнатура, версия, m, k, число собственных значений,
+# число объектов обучения, gamma, trace(C). Далее — means, eigenvalues и W
+# (построчно), всё в little-endian double; длина заголовка кратна 8.
+_MAGIC = b'PCAM'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQQQQdd')
+
+
+class PCAModel:
+    """
+    Обученная модель PCA: владеет W, means, собственными значениями и gamma.
+
+    Вход (конструктор):
+      k, threshold, solver, seed, oversampling, cache — как у pca
+    Атрибуты после fit:
+      W:              Matrix (m×k) — главные компоненты
+      means:          list[float]  — средние по колонкам
+      eigenvalues:    list[float]  — собственные значения по убыванию
+      gamma:          float        — доля объяснённой дисперсии
+      total_variance: float        — trace(C)
+      n_samples:      int          — число объектов обучения
+      n_iter:         int          — сумма итераций решателей при fit
+      iterations_saved: int        — экономия итераций от warm_start (или None)
+    """
+
+    def __init__(self, k: int = None, threshold: float = 0.95, solver: str = 'auto',
+                 seed: int = None, oversampling: int = 10, cache: PCACache = None):
+        self.k = k
+        self.threshold = threshold
+        self.solver = solver
+        self.seed = seed
+        self.oversampling = oversampling
+        self.cache = cache
+        self.W: Matrix = None
+        self.means: List[float] = []
+        self.eigenvalues: List[float] = []
+        self.gamma = 0.0
+        self.total_variance = 0.0
+        self.n_samples = 0
+        self.n_iter = 0
+        self.iterations_saved: int = None
+
+    @classmethod
+    def from_components(cls, W: 'Matrix', means: List[float], eigenvalues: List[float],
+                        gamma: float, total_variance: float = 0.0,
+                        n_samples: int = 0) -> 'PCAModel':
+        """Собирает модель из уже найденных компонент (например, из pca)."""
+        model = cls(k=W.cols)
+        model.W = W
+        model.means = list(means)
+        model.eigenvalues = list(eigenvalues)
+        model.gamma = gamma
+        model.total_variance = total_variance
+        model.n_samples = n_samples
+        return model
+
+    def fit(self, X: 'Matrix', stats: PCAStats = None,
+            warm_start: 'PCAModel' = None) -> 'PCAModel':
+        """
+        Обучает модель на X. warm_start — предыдущая модель (или пара
+        (W, eigenvalues)) как начальное подпространство, см. pca.
+        """
+        # Число итераций решатель возвращает сам, без stats: по нему
+        # следующая подгонка с warm_start=self определяет iterations_saved
+        (self.W, self.means, self.eigenvalues, self.gamma, self.total_variance,
+         _, self.n_iter) = _fit(X, self.k, self.threshold, self.solver, self.seed,
+                                self.oversampling, self.cache, stats, None, warm_start)
+        self.k = self.W.cols
+        self.n_samples = X.rows
+        self.iterations_saved = _iterations_saved(warm_start, self.n_iter)
+        return self
+
+    def transform(self, X: 'Matrix', out: 'Matrix' = None) -> 'Matrix':
+        """Проекция (X − 1·μᵀ)·W, поблочно; out — как у project_data."""
+        self._check_fitted()
+        return project_data(X, self.W, self.means, out=out)
+
+    def fit_transform(self, X: 'Matrix') -> 'Matrix':
+        return self.fit(X).transform(X)
+
+    def inverse_transform(self, Z: 'Matrix') -> 'Matrix':
+        """
+        Восстановление Z·Wᵀ + 1·μᵀ. Строки W используются напрямую,
+        поэтому Wᵀ не строится.
+        """
+        self._check_fitted()
+        m, k = self.W.rows, self.W.cols
+        if Z.cols != k:
+            raise ValueError(f"Ожидалась проекция с {k} столбцами, получено {Z.cols}")
+        w_rows = [(mu, row.tolist()) for mu, row in zip(self.means, self.W.data)]
+        out = Matrix((Z.rows, m))
+        for z, dst in zip(Z.data, out.data):
+            zl = z.tolist()
+            dst[:] = array('d', [mu + sum(map(mul, w, zl)) for mu, w in w_rows])
+        return out
+
+    def score_samples(self, X: 'Matrix') -> array:
+        """Ошибка восстановления каждой строки X, см. reconstruction_scores."""
+        self._check_fitted()
+        return reconstruction_scores(X, self.W, self.means)
+
+    def reconstruction_mse(self) -> float:
+        """MSE восстановления обучающих данных по отброшенным λ, без данных."""
+        self._check_fitted()
+        return expected_reconstruction_mse(self.total_variance, self.eigenvalues, self.k,
+                                           self.n_samples, self.W.rows)
+
+    def save(self, path: str):
+        """Сохраняет модель в компактный двоичный файл (см. load)."""
+        self._check_fitted()
+        m, k = self.W.rows, self.W.cols
+        header = _HEADER.pack(_MAGIC, _VERSION, m, k, len(self.eigenvalues),
+                              self.n_samples, self.gamma, self.total_variance)
+        payload = array('d', self.means)
+        payload.extend(self.eigenvalues)
+        payload.extend(self.W._values())
+        if sys.byteorder != 'little':
+            payload.byteswap()
+        with open(path, 'wb') as f:
+            f.write(header)
+            payload.tofile(f)
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> 'PCAModel':
+        """
+        Загружает модель, сохранённую save. При use_mmap=True файл
+        отображается в память и W разделяет страницы с ним (только чтение),
+        так что загрузка не зависит от размера W.
+        """
+        with open(path, 'rb') as f:
+            if use_mmap:
+                raw = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                raw = memoryview(f.read())
+        if len(raw) < _HEADER.size:
+            raise ValueError("Файл слишком короткий для модели PCA")
+        magic, version, m, k, n_eig, n_samples, gamma, total = _HEADER.unpack_from(raw)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Неизвестный формат файла модели PCA")
+        body = len(raw) - _HEADER.size
+        if body % 8 or body != 8 * (m + n_eig + m * k):
+            raise ValueError("Размер файла не соответствует заголовку модели")
+        values = raw[_HEADER.size:].cast('d')
+        if sys.byteorder != 'little':
+            swapped = array('d', values)
+            swapped.byteswap()
+            values = memoryview(swapped)
+        means = values[:m].tolist()
+        eigenvalues = values[m:m + n_eig].tolist()
+        W = Matrix.from_buffer(values[m + n_eig:], (m, k))
+        return cls.from_components(W, means, eigenvalues, gamma, total, n_samples)
+
+    def _check_fitted(self):
+        if self.W is None:
+            raise ValueError("Модель ещё не обучена: вызовите fit")
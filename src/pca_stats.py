@@ -0,0 +1,67 @@
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List
+
+_NULL = nullcontext()
+
+
+class PCAStats:
+    """
+    Необязательный сборщик статистики выполнения pca.
+
+    Передаётся аргументом stats=; если он не передан, функции не делают
+    никакой дополнительной работы.
+
+    Атрибуты:
+      stages:     время каждого этапа в секундах
+      allocated:  пик выделенной памяти на этапе в байтах (track_memory=True)
+      iterations: события решателей — solver, index, iterations, converged
+      residuals:  ‖C·w_j − λ_j·w_j‖ для каждой отобранной компоненты
+      n_iter:     сумма итераций решателей за последнюю подгонку
+      iterations_saved: на сколько итераций меньше, чем у подгонки,
+                  переданной как warm_start (если её n_iter известен)
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.n_iter = 0
+        self.iterations_saved: int = None
+        self.stages: Dict[str, float] = {}
+        self.allocated: Dict[str, int] = {}
+        self.iterations: List[Dict[str, Any]] = []
+        self.residuals: List[float] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        started_tracing = False
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+            if self.track_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                self.allocated[name] = max(self.allocated.get(name, 0), peak - base)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def record_iterations(self, solver: str, index: int, iterations: int, converged: bool):
+        self.iterations.append({"solver": solver, "index": index,
+                                "iterations": iterations, "converged": converged})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"stages": dict(self.stages), "allocated": dict(self.allocated),
+                "iterations": list(self.iterations), "residuals": list(self.residuals),
+                "n_iter": self.n_iter, "iterations_saved": self.iterations_saved}
+
+
+def stage(stats: PCAStats, name: str):
+    """Контекст замера этапа; без stats — общий пустой контекст."""
+    return _NULL if stats is None else stats.stage(name)
@@ -1,20 +1,190 @@
+import math
+import random
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
 from src.Matrix import Matrix
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
 
-def plot_pca_projection(X_proj: 'Matrix') -> Figure:
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Сколько точек рисуется поточечно в режиме 'auto'; больше — гистограмма
+_MAX_SCATTER = 50_000
+
+def plot_pca_projection(X_proj: 'Matrix', labels: Sequence[Any] = None, mode: str = 'auto',
+                        bins: int = 200, max_points: int = _MAX_SCATTER,
+                        sample: str = 'reservoir', extent: Tuple[float, float, float, float] = None,
+                        seed: int = None) -> 'Figure':
     """
     Вход: проекция данных X_proj (n×2) – двумерное представление данных
-    Выход: объект Figure с графиком рассеяния точек в новом пространстве
+      labels:     метки строк (len=n) для раскраски; None — один цвет
+      mode:       'scatter' — точки (не больше max_points, остальные
+                              отбрасываются выборкой sample),
+                  'hist2d'  — плотность на сетке bins×bins,
+                  'hexbin'  — плотность на шестиугольной сетке,
+                  'auto'    — 'scatter' при n ≤ max_points, иначе 'hist2d'
+      sample:     'reservoir'  — равномерная выборка за один проход,
+                  'stratified' — та же доля из каждой метки (нужны labels)
+      extent:     (xmin, xmax, ymin, ymax) для сетки; по умолчанию границы данных
+      seed:       зерно выборки
+    Выход: объект Figure с графиком точек или плотности в новом пространстве
+
+    Гистограммы накапливаются за один проход по столбцам X_proj, и на
+    график попадает только сетка, поэтому время отрисовки и память не
+    растут с n.
     """
     if not isinstance(X_proj, Matrix) or X_proj.cols != 2:
         raise ValueError("Для визуализации размерность проекции должна быть 2 и тип Matrix")
-    x_coords = [X_proj.data[i][0] for i in range(X_proj.rows)]
-    y_coords = [X_proj.data[i][1] for i in range(X_proj.rows)]
+    n = X_proj.rows
+    if labels is not None and len(labels) != n:
+        raise ValueError("Число меток должно совпадать с числом строк X_proj")
+    if mode == 'auto':
+        mode = 'scatter' if n <= max_points else 'hist2d'
+    if mode not in ('scatter', 'hist2d', 'hexbin'):
+        raise ValueError(f"Неизвестный режим '{mode}'")
+    # matplotlib импортируется только при построении графика
+    import matplotlib.pyplot as plt
     fig = plt.figure(figsize=(8, 8))
     ax = fig.add_subplot(1, 1, 1)
-    ax.scatter(x_coords, y_coords, s=10, alpha=0.7)
+    classes = sorted(set(labels), key=str) if labels is not None else [None]
+    colors = {c: plt.get_cmap('tab10')(i % 10) for i, c in enumerate(classes)}
+
+    if mode == 'scatter':
+        rows = range(n)
+        if n > max_points:
+            rng = random.Random(seed)
+            if sample == 'stratified':
+                if labels is None:
+                    raise ValueError("Для sample='stratified' нужны labels")
+                rows = _stratified_sample(labels, max_points, rng)
+            elif sample == 'reservoir':
+                rows = _reservoir_sample(n, max_points, rng)
+            else:
+                raise ValueError(f"Неизвестный способ выборки '{sample}'")
+        data = X_proj.data
+        for c in classes:
+            picked = [i for i in rows if labels is None or labels[i] == c]
+            ax.scatter([data[i][0] for i in picked], [data[i][1] for i in picked],
+                       s=10, alpha=0.7, color=colors[c] if labels is not None else None,
+                       label=None if labels is None else str(c))
+    else:
+        if extent is None:
+            xs, ys = X_proj._column(0), X_proj._column(1)
+            extent = (min(xs), max(xs), min(ys), max(ys)) if n else (0.0, 1.0, 0.0, 1.0)
+        # Для 'hexbin' сетка мельче, её клетки затем сводятся в шестиугольники
+        # (раскраска по меткам есть только у 'hist2d')
+        fine = bins if mode == 'hist2d' else 2 * bins
+        grids = _bin_counts(X_proj, fine, extent, labels if mode == 'hist2d' else None)
+        x0, x1, y0, y1 = _padded(extent)
+        if mode == 'hist2d':
+            _draw_density(ax, grids, colors, (x0, x1, y0, y1), labels is not None)
+        else:
+            dx, dy = (x1 - x0) / fine, (y1 - y0) / fine
+            total = grids[None]
+            cells = [(x0 + (t % fine + 0.5) * dx, y0 + (t // fine + 0.5) * dy, cnt)
+                     for t, cnt in enumerate(total) if cnt]
+            ax.hexbin([c[0] for c in cells], [c[1] for c in cells], C=[c[2] for c in cells],
+                      reduce_C_function=sum, gridsize=bins, extent=(x0, x1, y0, y1),
+                      bins='log', cmap='viridis', mincnt=1)
+        if labels is not None and mode == 'hist2d':
+            for c in classes:
+                ax.scatter([], [], color=colors[c], label=str(c))
+    if labels is not None:
+        ax.legend(loc='best', markerscale=2)
     ax.set_title("Проекция данных на 2 главные компоненты")
     ax.set_xlabel("Главная компонента 1")
     ax.set_ylabel("Главная компонента 2")
     return fig
+
+
+def _padded(extent):
+    """Границы сетки; вырожденный диапазон расширяется, чтобы шаг был > 0."""
+    x0, x1, y0, y1 = extent
+    if x1 <= x0:
+        x0, x1 = x0 - 0.5, x0 + 0.5
+    if y1 <= y0:
+        y0, y1 = y0 - 0.5, y0 + 0.5
+    return x0, x1, y0, y1
+
+
+def _bin_counts(X_proj: 'Matrix', bins: int, extent,
+                labels: Sequence[Any] = None) -> Dict[Any, List[int]]:
+    """
+    Счётчики точек на сетке bins×bins (по строкам сетки, y — номер строки)
+    для каждой метки (ключ None без меток). Один проход по X_proj; точки
+    вне extent отбрасываются.
+    """
+    x0, x1, y0, y1 = _padded(extent)
+    sx, sy = bins / (x1 - x0), bins / (y1 - y0)
+    grids: Dict[Any, List[int]] = {}
+    last = bins - 1
+    for i, (x, y) in enumerate(zip(X_proj._column(0), X_proj._column(1))):
+        if not (x0 <= x <= x1 and y0 <= y <= y1):
+            continue
+        key = labels[i] if labels is not None else None
+        grid = grids.get(key)
+        if grid is None:
+            grid = grids[key] = [0] * (bins * bins)
+        grid[min(int((y - y0) * sy), last) * bins + min(int((x - x0) * sx), last)] += 1
+    if not grids:
+        grids[None] = [0] * (bins * bins)
+    return grids
+
+
+def _draw_density(ax, grids, colors, extent, by_label: bool):
+    """Плотность в логарифмической шкале; с метками цвет клетки — смесь цветов меток."""
+    cells = len(next(iter(grids.values())))
+    bins = int(math.isqrt(cells))
+    total = [sum(col) for col in zip(*grids.values())]
+    peak = math.log1p(max(total)) or 1.0
+    if not by_label:
+        image = [[math.log1p(total[r * bins + c]) if total[r * bins + c] else float('nan')
+                  for c in range(bins)] for r in range(bins)]
+        im = ax.imshow(image, origin='lower', extent=extent, aspect='auto',
+                       cmap='viridis', interpolation='nearest')
+        ax.figure.colorbar(im, ax=ax, label="log(1 + число точек)")
+        return
+    image = []
+    for r in range(bins):
+        row = []
+        for c in range(bins):
+            t = r * bins + c
+            cnt = total[t]
+            if not cnt:
+                row.append((1.0, 1.0, 1.0, 0.0))
+                continue
+            rgb = [sum(grids[k][t] * colors[k][ch] for k in grids) / cnt for ch in range(3)]
+            row.append((*rgb, 0.25 + 0.75 * math.log1p(cnt) / peak))
+        image.append(row)
+    ax.imshow(image, origin='lower', extent=extent, aspect='auto', interpolation='nearest')
+
+
+def _reservoir_sample(n: int, size: int, rng: random.Random) -> List[int]:
+    """Равномерная выборка size индексов из range(n) за один проход (алгоритм R)."""
+    reservoir = list(range(min(n, size)))
+    for i in range(size, n):
+        j = rng.randrange(i + 1)
+        if j < size:
+            reservoir[j] = i
+    return sorted(reservoir)
+
+
+def _stratified_sample(labels: Sequence[Any], size: int, rng: random.Random) -> List[int]:
+    """
+    Выборка около size индексов, в которой доля каждой метки та же, что
+    в labels (не меньше одной строки на метку); внутри метки — резервуар.
+    """
+    counts = Counter(labels)
+    n = len(labels)
+    quota = {c: max(1, round(size * cnt / n)) for c, cnt in counts.items()}
+    reservoirs: Dict[Any, List[int]] = {c: [] for c in counts}
+    seen: Dict[Any, int] = dict.fromkeys(counts, 0)
+    for i, c in enumerate(labels):
+        seen[c] += 1
+        res, q = reservoirs[c], quota[c]
+        if len(res) < q:
+            res.append(i)
+        else:
+            j = rng.randrange(seen[c])
+            if j < q:
+                res[j] = i
+    return sorted(i for res in reservoirs.values() for i in res)
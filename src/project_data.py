@@ -0,0 +1,51 @@
+from array import array
+from operator import mul, sub
+from src.Matrix import Matrix
+from src.SparseMatrix import SparseMatrix
+from src.missing_values import MissingMask
+
+# Размер блока строк при проецировании
+_CHUNK_ROWS = 4096
+
+
+def project_data(X: 'Matrix', W: 'Matrix', means, mask: 'MissingMask' = None,
+                 out: 'Matrix' = None) -> 'Matrix':
+    """
+    Вход:
+      X:     Matrix или SparseMatrix (n×m) — данные
+      W:     Matrix (m×k) — главные компоненты
+      means: list[float]  — средние по колонкам (len=m)
+      mask:  MissingMask  — если задана, пропуски X считаются равными
+                            среднему столбца (их вклад в проекцию нулевой)
+      out:   Matrix (n×k)  — куда записать результат (например, create_npy);
+                            по умолчанию создаётся новая матрица
+    Выход:
+      X_proj: Matrix (n×k) = (X − 1·μᵀ)·W (тот же объект, что out, если задан)
+
+    Центрирование выполняется поблочно, полная центрированная копия X
+    не создаётся.
+    """
+    n, k = X.rows, W.cols
+    if X.cols != W.rows or len(means) != X.cols:
+        raise ValueError("Несогласованные размеры X, W и means")
+    if out is not None and out.shape() != (n, k):
+        raise ValueError(f"out должна иметь форму {n}×{k}, получено {out.rows}×{out.cols}")
+    if isinstance(X, SparseMatrix):
+        # (X − 1·μᵀ)·W = X·W − 1·(μᵀW): разреженная X не уплотняется
+        P = X @ W
+        X_proj = out if out is not None else P
+        offset = array('d', [sum(map(mul, means, W._column(j))) for j in range(k)])
+        for dst, row in zip(X_proj.data, P.data):
+            dst[:] = array('d', map(sub, row, offset))
+        return X_proj
+    X_proj = out if out is not None else Matrix((n, k))
+    for start in range(0, n, _CHUNK_ROWS):
+        block = X.row_block(start, start + _CHUNK_ROWS)
+        centered = Matrix([[v - mu for v, mu in zip(row, means)] for row in block.data])
+        if mask is not None:
+            for i, row in enumerate(centered.data):
+                for j in mask.missing_in_row(start + i):
+                    row[j] = 0.0
+        for i, row in enumerate((centered @ W).data):
+            X_proj.data[start + i][:] = row
+    return X_proj
@@ -0,0 +1,134 @@
+import math
+import random
+from operator import mul
+from typing import List
+from src.Matrix import Matrix
+from src.SparseMatrix import SparseMatrix
+from src.orthonormalize import orthonormalize_columns
+from src.project_data import project_data
+from src.symmetric_eigen import symmetric_eigen
+
+# Размер блока строк при проходах по X
+_CHUNK_ROWS = 4096
+
+
+def randomized_pca(X: 'Matrix', k: int, oversampling: int = 10, n_iter: int = 4,
+                   seed: int = None):
+    """
+    PCA через рандомизированный SVD центрированных данных, без построения
+    ковариационной матрицы (m×m).
+
+    Вход:
+      X:            Matrix (n×m) — исходные данные
+      k:            число компонент
+      oversampling: число дополнительных столбцов гауссова эскиза
+      n_iter:       число степенных итераций (уточняют медленно
+                    убывающий спектр)
+      seed:         зерно генератора для воспроизводимости
+    Выход:
+      (X_proj, gamma, W, means) — как у pca
+
+    Центрирование неявное: Xc·Ω = X·Ω − 1·(μᵀΩ) считается поблочно,
+    поэтому стоимость O(n·m·(k + oversampling)) на проход.
+    """
+    W, means, _, gamma, _ = randomized_fit(X, k, oversampling, n_iter, seed)
+    return project_data(X, W, means), gamma, W, means
+
+
+def randomized_fit(X: 'Matrix', k: int, oversampling: int = 10, n_iter: int = 4,
+                   seed: int = None):
+    """
+    Обучающая часть randomized_pca.
+    Выход: (W, means, eigenvalues, gamma, total_variance) — как у fit_pca.
+    """
+    n, m = X.rows, X.cols
+    if n == 0 or m == 0:
+        raise ValueError("Пустая матрица X")
+    if k is None:
+        raise ValueError("Для solver='randomized' необходимо задать k")
+    # Ранг Xc не больше min(n, m): больше компонент эскиз не найдёт
+    if not (1 <= k <= min(m, n)):
+        raise ValueError(f"k должно быть в диапазоне [1, {min(m, n)}], получено {k}")
+    rng = random.Random(seed)
+    l = min(m, n, k + oversampling)
+
+    # Средние и полная дисперсия trace(C) — по столбцам, без C
+    denom = n - 1 if n > 1 else 1
+    if isinstance(X, SparseMatrix):
+        means = [s / n for s in X.column_sums()]
+        total = sum(q - n * mu * mu for q, mu in zip(X.column_sq_sums(), means)) / denom
+    else:
+        means = [sum(X._column(j)) / n for j in range(m)]
+        total = sum(sum((v - mu) ** 2 for v in X._column(j))
+                    for j, mu in enumerate(means)) / denom
+
+    # Эскиз диапазона: Q = orth(Xc·Ω), затем степенные итерации
+    omega = [[rng.gauss(0.0, 1.0) for _ in range(m)] for _ in range(l)]
+    Q = orthonormalize_columns(_apply(X, means, omega), rng)
+    for _ in range(n_iter):
+        P = orthonormalize_columns(_apply_transposed(X, means, Q), rng)
+        Q = orthonormalize_columns(_apply(X, means, P), rng)
+
+    # B = Qᵀ·Xc (l×m); B·Bᵀ = U·diag(s²)·Uᵀ, правые сингулярные векторы Bᵀu/s
+    Bt = _apply_transposed(X, means, Q)
+    BBt = Matrix([[sum(map(mul, bi, bj)) for bj in Bt] for bi in Bt])
+    s2, U = symmetric_eigen(BBt)
+    W = Matrix((m, k))
+    eigenvalues: List[float] = []
+    for j in range(k):
+        u = U._column(j).tolist()
+        s = math.sqrt(max(s2[j], 0.0))
+        eigenvalues.append(s2[j] / denom)
+        v = [0.0] * m
+        for c, b in zip(u, Bt):
+            if c != 0.0:
+                v = [a + c * t for a, t in zip(v, b)]
+        norm = s if s > 0.0 else (math.sqrt(sum(t * t for t in v)) or 1.0)
+        for i in range(m):
+            W.data[i][j] = v[i] / norm
+
+    gamma = sum(eigenvalues) / total if total > 0 else 0.0
+    return W, means, eigenvalues, gamma, total
+
+
+def _apply(X: Matrix, means: List[float], vectors: List[List[float]]) -> List[List[float]]:
+    """Xc·v для каждого v (длины m); результат — векторы длины n."""
+    if isinstance(X, SparseMatrix):
+        # Xc·v = X·v − (μ·v)·1: разреженная матрица не уплотняется
+        P = X @ _columns(vectors)
+        offsets = [sum(map(mul, means, vec)) for vec in vectors]
+        return [[t - o for t in P._column(c)] for c, o in enumerate(offsets)]
+    out: List[List[float]] = [[] for _ in vectors]
+    for start in range(0, X.rows, _CHUNK_ROWS):
+        block = X.row_block(start, start + _CHUNK_ROWS)
+        rows = [[v - mu for v, mu in zip(row, means)] for row in block.data]
+        for res, vec in zip(out, vectors):
+            res.extend([sum(map(mul, r, vec)) for r in rows])
+    return out
+
+
+def _apply_transposed(X: Matrix, means: List[float], vectors: List[List[float]]) -> List[List[float]]:
+    """Xcᵀ·q для каждого q (длины n); результат — векторы длины m."""
+    if isinstance(X, SparseMatrix):
+        # Xcᵀ·q = Xᵀ·q − μ·(1ᵀq)
+        P = X.transpose() @ _columns(vectors)
+        sums = [sum(vec) for vec in vectors]
+        return [[t - mu * s for t, mu in zip(P._column(c), means)] for c, s in enumerate(sums)]
+    m = X.cols
+    out = [[0.0] * m for _ in vectors]
+    for start in range(0, X.rows, _CHUNK_ROWS):
+        stop = min(X.rows, start + _CHUNK_ROWS)
+        cols = [[v - mu for v in X._column(j, start, stop)] for j, mu in enumerate(means)]
+        for res, vec in zip(out, vectors):
+            part = vec[start:stop]
+            res[:] = [a + sum(map(mul, col, part)) for a, col in zip(res, cols)]
+    return out
+
+
+def _columns(vectors: List[List[float]]) -> Matrix:
+    """Matrix, столбцами которой служат vectors."""
+    res = Matrix((len(vectors[0]), len(vectors)))
+    for c, vec in enumerate(vectors):
+        for i, t in enumerate(vec):
+            res.data[i][c] = t
+    return res
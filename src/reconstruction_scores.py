@@ -0,0 +1,89 @@
+import heapq
+from array import array
+from operator import sub
+from typing import Iterable, Iterator, List, Tuple
+from src.Matrix import Matrix
+
+# Размер блока строк при подсчёте оценок
+_CHUNK_ROWS = 4096
+
+
+def reconstruction_scores(X: 'Matrix', W: 'Matrix', means: List[float]) -> array:
+    """
+    Квадрат ошибки восстановления каждой строки без построения
+    восстановленной матрицы.
+
+    Вход:
+      X:     Matrix (n×m) — данные
+      W:     Matrix (m×k) — главные компоненты (ортонормированные столбцы)
+      means: list[float]  — средние по колонкам (len=m)
+    Выход:
+      array('d') длины n: ‖x − μ‖² − ‖Wᵀ(x − μ)‖² для каждой строки
+
+    Строки обрабатываются блоками по _CHUNK_ROWS; на строку приходится
+    O(m·k) операций и O(m + k) памяти сверх блока.
+    """
+    if X.cols != W.rows or len(means) != X.cols:
+        raise ValueError("Несогласованные размеры X, W и means")
+    scores = array('d')
+    for block_scores in iter_reconstruction_scores(
+            (X.row_block(start, start + _CHUNK_ROWS) for start in range(0, X.rows, _CHUNK_ROWS)),
+            W, means):
+        scores.extend(block_scores)
+    return scores
+
+
+def iter_reconstruction_scores(chunks: Iterable, W: 'Matrix',
+                               means: List[float]) -> Iterator[array]:
+    """
+    Потоковый вариант reconstruction_scores: для каждого блока строк
+    (Matrix или списки строк) выдаёт array('d') с оценками его строк.
+    """
+    m = W.rows
+    for chunk in chunks:
+        block = chunk if isinstance(chunk, Matrix) else Matrix(chunk)
+        if block.rows == 0:
+            continue
+        if block.cols != m:
+            raise ValueError(f"Ожидались строки длины {m}, получено {block.cols}")
+        centered = Matrix.from_buffer(
+            array('d', (v for row in block.data for v in map(sub, row, means))),
+            (block.rows, m))
+        proj = centered @ W
+        # Остаток не бывает отрицательным; погрешность округления отсекается
+        yield array('d', [max(0.0, sum(v * v for v in c) - sum(p * p for p in z))
+                          for c, z in zip(centered.data, proj.data)])
+
+
+def top_anomalies(scores: Iterable[float], top_n: int = None,
+                  threshold: float = None) -> List[Tuple[int, float]]:
+    """
+    Отбор строк с наибольшей ошибкой восстановления.
+
+    Вход:
+      scores:    оценки строк (например, из reconstruction_scores)
+      top_n:     вернуть не больше top_n строк с наибольшими оценками
+      threshold: вернуть только строки с оценкой > threshold
+    Выход:
+      список (индекс строки, оценка) по убыванию оценки
+    """
+    candidates = ((i, s) for i, s in enumerate(scores)
+                  if threshold is None or s > threshold)
+    if top_n is not None:
+        return heapq.nlargest(top_n, candidates, key=lambda t: t[1])
+    return sorted(candidates, key=lambda t: t[1], reverse=True)
+
+
+def expected_reconstruction_mse(total_variance: float, eigenvalues: List[float], k: int,
+                                n_samples: int, m: int) -> float:
+    """
+    MSE восстановления обучающих данных в закрытой форме, как у
+    reconstruction_error, но без самих данных:
+      (trace(C) − Σ_{i≤k} λ_i) · (n − 1) / (n · m).
+
+    Для PCAModel: total_variance, eigenvalues, k, n_samples и W.rows.
+    """
+    if n_samples <= 0 or m <= 0:
+        return 0.0
+    discarded = max(0.0, total_variance - sum(eigenvalues[:k]))
+    return discarded * max(n_samples - 1, 1) / (n_samples * m)
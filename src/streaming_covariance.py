@@ -0,0 +1,87 @@
+from array import array
+from typing import Iterable, List, Tuple
+from src.Matrix import Matrix
+from src.gram_matrix import gram_matrix
+
+
+class StreamingCovariance:
+    """
+    Потоковый накопитель средних и ковариации по блокам строк.
+
+    Для каждого блока считаются число строк, среднее и со-момент
+    M = Σ (x − μ)(x − μ)ᵀ, после чего блок сливается с накопленным
+    состоянием по формулам Чана (обобщение Уэлфорда):
+      δ = μ_b − μ_a,  n = n_a + n_b,
+      μ = μ_a + δ·n_b/n,
+      M = M_a + M_b + δδᵀ·n_a·n_b/n.
+    В памяти одновременно находится не больше одного блока.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.means: List[float] = []
+        self.comoment: Matrix = None
+
+    def update(self, chunk) -> 'StreamingCovariance':
+        """
+        Вход:
+          chunk: Matrix (b×m) или последовательность строк длины m
+        """
+        block = chunk if isinstance(chunk, Matrix) else Matrix(chunk)
+        nb = block.rows
+        if nb == 0:
+            return self
+        mb = [sum(block._column(j)) / nb for j in range(block.cols)]
+        Mb = gram_matrix(block, means=mb)
+        self._merge(nb, mb, Mb)
+        return self
+
+    def merge(self, other: 'StreamingCovariance') -> 'StreamingCovariance':
+        """Сливает состояние другого накопителя в текущее."""
+        if other.count > 0:
+            self._merge(other.count, list(other.means), other.comoment.copy())
+        return self
+
+    def _merge(self, nb: int, mb: List[float], Mb: Matrix):
+        na = self.count
+        if na == 0:
+            self.count, self.means, self.comoment = nb, mb, Mb
+            return
+        if len(mb) != len(self.means):
+            raise ValueError("Число столбцов блока не совпадает с накопленным")
+        n = na + nb
+        delta = [b - a for a, b in zip(self.means, mb)]
+        f = na * nb / n
+        self.means = [a + d * nb / n for a, d in zip(self.means, delta)]
+        Ma = self.comoment
+        for i, di in enumerate(delta):
+            fdi = f * di
+            Ma.data[i][:] = array('d', [a + b + fdi * dj for a, b, dj
+                                        in zip(Ma.data[i], Mb.data[i], delta)])
+        self.count = n
+
+    def covariance(self) -> Matrix:
+        """Выборочная ковариация C = M / (n − 1), как в covariance_matrix."""
+        m = len(self.means)
+        if self.count == 0:
+            return Matrix((0, 0))
+        denom = self.count - 1 if self.count > 1 else 1
+        scale = 1.0 / denom
+        return Matrix.from_buffer(array('d', [v * scale for v in self.comoment._values()]),
+                                  (m, m))
+
+
+def streaming_mean_covariance(chunks: Iterable) -> Tuple[List[float], Matrix]:
+    """
+    Вход:
+      chunks: итератор блоков строк (Matrix или списки строк),
+              например из генератора или чтения файла
+    Выход:
+      (means, C) — вектор средних (len=m) и ковариационная матрица (m×m)
+    """
+    acc = StreamingCovariance()
+    for chunk in chunks:
+        acc.update(chunk)
+    if acc.count == 0:
+        raise ValueError("Пустой поток данных")
+    return acc.means, acc.covariance()
@@ -0,0 +1,79 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Sequence
+from src import parallel
+from src.explained_variance_ratio import explained_variance_ratio
+from src.knn_accuracy import knn_accuracy
+from src.load_dataset import load_dataset
+from src.pca import fit_pca
+from src.project_data import project_data
+
+
+def sweep_pca(datasets: Sequence[str], ks: Sequence[int] = None,
+              n_jobs: int = None) -> List[Dict[str, Any]]:
+    """
+    Перебор (датасет × k) для выбора числа компонент.
+
+    Каждый датасет загружается один раз, для него строится одно полное
+    разложение, и проекции для всех k берутся как первые k столбцов общей
+    проекции. 1-NN оценки (до PCA и для каждого k) независимы и
+    распределяются по пулу процессов.
+
+    Вход:
+      datasets: имена датасетов ('iris', 'wine', 'digits', 'breast_cancer')
+      ks:       значения k; None — все от 1 до m. k вне [1, m] пропускаются
+      n_jobs:   число процессов; None — parallel.get_num_workers()
+                (общая настройка, см. parallel.set_num_workers), 1 — без пула
+    Выход:
+      список строк-словарей с ключами dataset, k, gamma, acc_before,
+      acc_after, load_time, fit_time, knn_time
+    """
+    prepared = []
+    tasks = []
+    for name in datasets:
+        t0 = time.perf_counter()
+        X, y = load_dataset(name)
+        load_time = time.perf_counter() - t0
+        m = X.cols
+        k_list = sorted({k for k in (ks if ks is not None else range(1, m + 1)) if 1 <= k <= m})
+        if not k_list:
+            continue
+        t0 = time.perf_counter()
+        W, means, eigenvalues, _, _ = fit_pca(X, max(k_list), solver='eigh')
+        proj = project_data(X, W, means).tolist()
+        fit_time = time.perf_counter() - t0
+        prepared.append((name, k_list, eigenvalues, load_time, fit_time))
+        tasks.append((name, None, X.tolist(), y))
+        for k in k_list:
+            tasks.append((name, k, [row[:k] for row in proj], y))
+
+    workers = parallel.get_num_workers() if n_jobs is None else n_jobs
+    if workers == 1 or len(tasks) <= 1:
+        outcomes = [_knn_task(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_knn_task, *zip(*tasks)))
+    scores = {(name, k): (acc, dt) for name, k, acc, dt in outcomes}
+
+    results: List[Dict[str, Any]] = []
+    for name, k_list, eigenvalues, load_time, fit_time in prepared:
+        acc_before, _ = scores[(name, None)]
+        for k in k_list:
+            acc_after, knn_time = scores[(name, k)]
+            results.append({
+                "dataset": name,
+                "k": k,
+                "gamma": explained_variance_ratio(eigenvalues, k),
+                "acc_before": acc_before,
+                "acc_after": acc_after,
+                "load_time": load_time,
+                "fit_time": fit_time,
+                "knn_time": knn_time,
+            })
+    return results
+
+
+def _knn_task(name: str, k, rows: List[List[float]], labels: List[Any]):
+    t0 = time.perf_counter()
+    acc = knn_accuracy(rows, labels)
+    return name, k, acc, time.perf_counter() - t0
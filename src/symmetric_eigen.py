@@ -0,0 +1,152 @@
+import math
+from array import array
+from itertools import chain
+from operator import mul
+from typing import List, Tuple
+from src.Matrix import Matrix
+from src.pca_stats import PCAStats
+
+_EPS = 2.0 ** -52
+
+
+def symmetric_eigen(C: 'Matrix', max_iter: int = 30,
+                    stats: PCAStats = None) -> Tuple[List[float], 'Matrix']:
+    """
+    Полное спектральное разложение симметричной матрицы C = V·diag(λ)·Vᵀ.
+
+    Матрица приводится к трёхдиагональному виду отражениями Хаусхолдера,
+    затем собственные значения находятся QL-алгоритмом с неявными сдвигами
+    (tred2/tql2). Собственные пары получаются за один вызов.
+
+    Вход:
+      C:        симметричная матрица (m×m)
+      max_iter: предел QL-итераций на одно собственное значение
+      stats:    PCAStats — записать число QL-итераций по каждому значению
+    Выход:
+      eigenvalues: список собственных значений по убыванию
+      V:           Matrix (m×m), столбцы — ортонормированные собственные векторы
+    """
+    n = C.rows
+    if C.cols != n:
+        raise ValueError("Матрица C должна быть квадратной")
+    if n == 0:
+        return [], Matrix((0, 0))
+    d, e, Z = _tridiagonalize(C.tolist())
+    _tridiagonal_ql(d, e, Z, max_iter, stats)
+    order = sorted(range(n), key=lambda i: d[i], reverse=True)
+    eigenvalues = [d[i] for i in order]
+    Vt = Matrix.from_buffer(array('d', chain.from_iterable(Z[i] for i in order)), (n, n))
+    return eigenvalues, Vt.transpose()
+
+
+def _tridiagonalize(A: List[List[float]]):
+    """
+    Приводит симметричную A к трёхдиагональной T = Qᵀ A Q.
+    Возвращает диагональ d, поддиагональ e (e[i] = T[i][i-1], e[0] = 0)
+    и строки Qᵀ (строка r — r-й столбец Q).
+    """
+    n = len(A)
+    Qt = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        Qt[i][i] = 1.0
+    for k in range(n - 2):
+        x = [A[r][k] for r in range(k + 1, n)]
+        norm_x = math.sqrt(sum(v * v for v in x))
+        if norm_x == 0.0:
+            continue
+        alpha = -math.copysign(norm_x, x[0])
+        v = x
+        v[0] -= alpha
+        norm_v = math.sqrt(sum(t * t for t in v))
+        if norm_v == 0.0:
+            continue
+        v = [t / norm_v for t in v]
+        # H = I − 2vvᵀ; хвостовой блок B ← HBH = B − vwᵀ − wvᵀ
+        p = [sum(map(mul, A[r][k + 1:], v)) for r in range(k + 1, n)]
+        K = sum(map(mul, v, p))
+        w = [2.0 * (pi - K * vi) for pi, vi in zip(p, v)]
+        for idx, r in enumerate(range(k + 1, n)):
+            vr, wr = v[idx], w[idx]
+            A[r][k + 1:] = [a - vr * wc - wr * vc
+                            for a, vc, wc in zip(A[r][k + 1:], v, w)]
+        A[k + 1][k] = A[k][k + 1] = alpha
+        # Qᵀ ← H Qᵀ
+        u = [0.0] * n
+        for idx, r in enumerate(range(k + 1, n)):
+            vr = v[idx]
+            if vr != 0.0:
+                u = [a + vr * b for a, b in zip(u, Qt[r])]
+        for idx, r in enumerate(range(k + 1, n)):
+            c = 2.0 * v[idx]
+            if c != 0.0:
+                Qt[r] = [q - c * t for q, t in zip(Qt[r], u)]
+    d = [A[i][i] for i in range(n)]
+    e = [0.0] + [A[i][i - 1] for i in range(1, n)]
+    return d, e, Qt
+
+
+def _tridiagonal_ql(d: List[float], e: List[float], Z: List[List[float]], max_iter: int,
+                    stats: PCAStats = None):
+    """
+    QL-алгоритм с неявными сдвигами для трёхдиагональной матрицы (d, e).
+    На выходе d — собственные значения, строки Z — собственные векторы.
+    """
+    n = len(d)
+    for i in range(1, n):
+        e[i - 1] = e[i]
+    e[n - 1] = 0.0
+    f = 0.0
+    tst1 = 0.0
+    for l in range(n):
+        tst1 = max(tst1, abs(d[l]) + abs(e[l]))
+        m = l
+        while m < n - 1 and abs(e[m]) > _EPS * tst1:
+            m += 1
+        it = 0
+        if m > l:
+            while True:
+                it += 1
+                if it > max_iter:
+                    raise ValueError("QL-итерации не сошлись")
+                # Сдвиг по ведущему 2×2 блоку
+                g = d[l]
+                p = (d[l + 1] - g) / (2.0 * e[l])
+                r = math.hypot(p, 1.0)
+                if p < 0:
+                    r = -r
+                d[l] = e[l] / (p + r)
+                d[l + 1] = e[l] * (p + r)
+                dl1 = d[l + 1]
+                h = g - d[l]
+                for i in range(l + 2, n):
+                    d[i] -= h
+                f += h
+                # Неявный QL-шаг
+                p = d[m]
+                c = c2 = c3 = 1.0
+                el1 = e[l + 1]
+                s = s2 = 0.0
+                for i in range(m - 1, l - 1, -1):
+                    c3 = c2
+                    c2 = c
+                    s2 = s
+                    g = c * e[i]
+                    h = c * p
+                    r = math.hypot(p, e[i])
+                    e[i + 1] = s * r
+                    s = e[i] / r
+                    c = p / r
+                    p = c * d[i] - s * g
+                    d[i + 1] = h + s * (c * g + s * d[i])
+                    zi, zi1 = Z[i], Z[i + 1]
+                    Z[i + 1] = [s * a + c * b for a, b in zip(zi, zi1)]
+                    Z[i] = [c * a - s * b for a, b in zip(zi, zi1)]
+                p = -s * s2 * c3 * el1 * e[l] / dl1
+                e[l] = s * p
+                d[l] = c * p
+                if abs(e[l]) <= _EPS * tst1:
+                    break
+        if stats is not None:
+            stats.record_iterations('symmetric_eigen', l, it, True)
+        d[l] += f
+        e[l] = 0.0
@@ -0,0 +1,140 @@
+import math
+import random
+import warnings
+from operator import mul
+from typing import List, Tuple
+from src.Matrix import Matrix
+from src.pca_stats import PCAStats
+from src.orthonormalize import orthonormalize_columns
+from src.symmetric_eigen import symmetric_eigen
+
+
+def top_k_eigen(C: 'Matrix', k: int = None, threshold: float = 0.95, tol: float = 1e-8,
+                max_iter: int = 1000, seed: int = None, stats: PCAStats = None,
+                init: 'Matrix' = None) -> Tuple[List[float], 'Matrix']:
+    """
+    Находит только k старших собственных пар симметричной матрицы C
+    блочной итерацией подпространств с проекцией Рэлея–Ритца.
+
+    Вход:
+      C:         симметричная неотрицательно определённая матрица (m×m)
+      k:         число пар; если None, k увеличивается, пока доля
+                 Σλ_i / trace(C) не достигнет threshold (как в auto_select_k)
+      threshold: порог объяснённой дисперсии для k=None
+      tol:       критерий остановки по невязке ‖Cv − λv‖ ≤ tol·|λ_1|
+      max_iter:  предел числа итераций
+      seed:      зерно для случайного начального подпространства
+      stats:     PCAStats — записать число итераций и сходимость по каждой паре
+      init:      Matrix (m×j) — тёплый старт: столбцы (например, W прошлой
+                 подгонки) задают начальное подпространство; при k=None
+                 поиск начинается сразу с j пар
+    Выход:
+      eigenvalues: k старших собственных значений по убыванию
+      V:           Matrix (m×k), столбцы — ортонормированные собственные векторы
+
+    Если за max_iter итераций невязка не опустилась до tol, выдаётся
+    RuntimeWarning и возвращаются текущие приближения.
+    """
+    return _top_k_eigen(C, k, threshold, tol, max_iter, seed, stats, init)[:2]
+
+
+def _top_k_eigen(C, k, threshold, tol, max_iter, seed, stats, init):
+    """top_k_eigen, дополнительно возвращающая число блочных итераций."""
+    m = C.rows
+    if C.cols != m:
+        raise ValueError("Матрица C должна быть квадратной")
+    rng = random.Random(seed)
+    rows = C.tolist()
+    start: List[List[float]] = []
+    if init is not None:
+        if init.rows != m:
+            raise ValueError(f"init должна иметь {m} строк, получено {init.rows}")
+        start = [init._column(j).tolist() for j in range(init.cols)]
+    if k is not None:
+        if not (1 <= k <= m):
+            raise ValueError(f"k должно быть в диапазоне [1, {m}], получено {k}")
+        vals, Q, n_iter, converged = _subspace_iteration(rows, k, tol, max_iter, rng, start,
+                                                         stats)
+        _check_converged(converged, max_iter)
+        return vals[:k], _columns_to_matrix(Q[:k], m), n_iter
+
+    if threshold <= 0 or threshold > 1:
+        raise ValueError("threshold должен быть в диапазоне (0, 1]")
+    total = sum(rows[i][i] for i in range(m))
+    kk = min(m, max(1, len(start)))
+    Q = start
+    n_iter = 0
+    while True:
+        vals, Q, it, converged = _subspace_iteration(rows, kk, tol, max_iter, rng, Q, stats)
+        _check_converged(converged, max_iter)
+        n_iter += it
+        cum = 0.0
+        for i, v in enumerate(vals[:kk], start=1):
+            cum += v
+            if total <= 0 or cum / total >= threshold:
+                return vals[:i], _columns_to_matrix(Q[:i], m), n_iter
+        if kk == m:
+            return vals[:m], _columns_to_matrix(Q[:m], m), n_iter
+        kk = min(m, 2 * kk)
+
+
+def _subspace_iteration(rows, k, tol, max_iter, rng, init, stats=None):
+    m = len(rows)
+    b = min(m, k + max(2, k // 2))
+    if 2 * b >= m:
+        # Блок сравним с размером матрицы — полное разложение дешевле
+        vals, V = symmetric_eigen(Matrix(rows), stats=stats)
+        return vals, [V._column(j).tolist() for j in range(m)], 0, True
+    Q = [list(q) for q in init[:b]]
+    Q += [[rng.gauss(0.0, 1.0) for _ in range(m)] for _ in range(b - len(Q))]
+    Q = orthonormalize_columns(Q, rng)
+    vals: List[float] = []
+    converged = False
+    it = 0
+    for it in range(1, max_iter + 1):
+        Y = [[sum(map(mul, row, q)) for row in rows] for q in Q]
+        # Рэлей–Ритц: H = QᵀCQ, H = SΘSᵀ; Ритц-векторы QS и CQS
+        H = Matrix([[sum(map(mul, qi, yj)) for yj in Y] for qi in Q])
+        vals, S = symmetric_eigen(H)
+        Sc = [S._column(j).tolist() for j in range(b)]
+        Q = [_combine(Q, s) for s in Sc]
+        Y = [_combine(Y, s) for s in Sc]
+        scale = max(abs(vals[0]), 1e-300)
+        converged = True
+        for i in range(k):
+            lam = vals[i]
+            res = math.sqrt(sum((y - lam * q) ** 2 for y, q in zip(Y[i], Q[i])))
+            if res > tol * scale:
+                converged = False
+                break
+        if converged:
+            break
+        Q = orthonormalize_columns(Y, rng)
+    if stats is not None:
+        # Одна блочная итерация обновляет все k пар сразу: запись одна,
+        # index — число пар в блоке
+        stats.record_iterations('top_k_eigen', k, it, converged)
+    return vals, Q, it, converged
+
+
+def _check_converged(converged: bool, max_iter: int):
+    if not converged:
+        warnings.warn(f"top_k_eigen: итерация подпространств не сошлась за {max_iter} итераций; "
+                      "возвращены текущие приближения Ритца", RuntimeWarning, stacklevel=4)
+
+
+def _combine(vectors: List[List[float]], coeffs: List[float]) -> List[float]:
+    """Линейная комбинация Σ c_j · vectors[j]."""
+    out = [0.0] * len(vectors[0])
+    for c, v in zip(coeffs, vectors):
+        if c != 0.0:
+            out = [a + c * t for a, t in zip(out, v)]
+    return out
+
+
+def _columns_to_matrix(cols: List[List[float]], m: int) -> Matrix:
+    res = Matrix((m, len(cols)))
+    for j, col in enumerate(cols):
+        for i in range(m):
+            res.data[i][j] = col[i]
+    return res
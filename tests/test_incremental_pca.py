@@ -0,0 +1,42 @@
+import random
+import time
+
+from src.Matrix import Matrix
+from src.incremental_pca import IncrementalPCA
+from src.pca import fit_pca
+
+
+def _data(n, m, seed=0):
+    rng = random.Random(seed)
+    return Matrix([[rng.gauss(0.0, 1.0) * (j + 1) for j in range(m)] for _ in range(n)])
+
+
+def _same_subspace(W1, W2, tol):
+    for j in range(W1.cols):
+        dot = sum(a * b for a, b in zip(W1._column(j), W2._column(j)))
+        assert abs(abs(dot) - 1.0) < tol
+
+
+def test_large_batches_with_few_columns():
+    X = _data(1800, 3)
+    t0 = time.perf_counter()
+    # k = m: обновление точное, сравнение с полным разложением
+    ipca = IncrementalPCA(3)
+    for start in range(0, X.rows, 600):
+        ipca.partial_fit(X.row_block(start, start + 600))
+    assert time.perf_counter() - t0 < 5.0
+    W, means, eigenvalues, _, _ = fit_pca(X, 3, solver='eigh')
+    assert ipca.n_samples == X.rows
+    assert max(abs(a - b) for a, b in zip(ipca.means, means)) < 1e-9
+    assert max(abs(a - b) for a, b in zip(ipca.eigenvalues, eigenvalues)) < 1e-8
+    _same_subspace(ipca.W, W, 1e-8)
+
+
+def test_small_batches_match_full_fit():
+    X = _data(120, 8, seed=1)
+    ipca = IncrementalPCA(8)
+    for start in range(0, X.rows, 10):
+        ipca.partial_fit(X.row_block(start, start + 10))
+    W, _, eigenvalues, _, _ = fit_pca(X, 8, solver='eigh')
+    assert max(abs(a - b) for a, b in zip(ipca.eigenvalues, eigenvalues)) < 1e-8
+    _same_subspace(ipca.W, W, 1e-8)
@@ -0,0 +1,52 @@
+import struct
+from array import array
+
+import pytest
+
+from src.load_matrix import _NPY_MAGIC, iter_row_chunks, load_npy
+
+_DTYPES = [('<f8', 'd'), ('<f4', 'f'), ('<i4', 'i'), ('<i8', 'q'), ('|u1', 'B'), ('|i1', 'b')]
+
+
+def _write_npy(path, descr, fmt, rows, fortran=False):
+    n, m = len(rows), len(rows[0])
+    flat = [rows[i][j] for j in range(m) for i in range(n)] if fortran else \
+        [v for row in rows for v in row]
+    header = f"{{'descr': '{descr}', 'fortran_order': {fortran}, 'shape': ({n}, {m}), }}"
+    pad = -(len(_NPY_MAGIC) + 4 + len(header) + 1) % 64
+    header = (header + ' ' * pad + '\n').encode('latin1')
+    values = array(fmt, flat)
+    path.write_bytes(_NPY_MAGIC + b'\x01\x00' + struct.pack('<H', len(header)) + header
+                     + values.tobytes())
+
+
+@pytest.mark.parametrize('descr, fmt', _DTYPES)
+@pytest.mark.parametrize('fortran', [False, True])
+def test_npy_round_trip(tmp_path, descr, fmt, fortran):
+    rows = [[1, -2, 3], [4, 5, -6]] if fmt != 'B' else [[1, 2, 3], [4, 5, 255]]
+    path = tmp_path / 'x.npy'
+    _write_npy(path, descr, fmt, rows, fortran)
+    for use_mmap in (True, False):
+        assert load_npy(str(path), use_mmap).tolist() == [[float(v) for v in r] for r in rows]
+
+
+def test_truncated_npy_is_rejected(tmp_path):
+    path = tmp_path / 'x.npy'
+    _write_npy(path, '<f4', 'f', [[1.0, 2.0], [3.0, 4.0]])
+    path.write_bytes(path.read_bytes()[:-2])
+    with pytest.raises(ValueError):
+        load_npy(str(path))
+
+
+def test_csv_chunks_reject_ragged_rows(tmp_path):
+    path = tmp_path / 'x.csv'
+    path.write_text("1,2,3\n4,5\n6,7,8,9\n")
+    with pytest.raises(ValueError, match="Строка 2"):
+        list(iter_row_chunks(str(path), 2))
+
+
+def test_csv_chunks_split_rows(tmp_path):
+    path = tmp_path / 'x.csv'
+    path.write_text("1,2\n3,4\n5,6\n")
+    assert [c.tolist() for c in iter_row_chunks(str(path), 2)] == [[[1.0, 2.0], [3.0, 4.0]],
+                                                                   [[5.0, 6.0]]]
@@ -0,0 +1,30 @@
+from array import array
+
+import pytest
+
+from src.Matrix import Matrix
+
+
+def test_from_buffer_shares_double_buffer():
+    buf = array('d', [1.0, 2.0, 3.0, 4.0])
+    M = Matrix.from_buffer(buf, (2, 2))
+    buf[3] = 9.0
+    assert M.tolist() == [[1.0, 2.0], [3.0, 9.0]]
+
+
+def test_from_buffer_reads_raw_bytes_as_doubles():
+    raw = bytearray(array('d', [1.5, -2.0]).tobytes())
+    assert Matrix.from_buffer(raw, (1, 2)).tolist() == [[1.5, -2.0]]
+
+
+def test_from_buffer_rejects_integer_buffer():
+    with pytest.raises(ValueError):
+        Matrix.from_buffer(array('q', [1, 2, 3, 4]), (2, 2))
+
+
+def test_rows_are_views_and_cannot_be_rebound():
+    M = Matrix([[1.0, 2.0], [3.0, 4.0]])
+    M.data[1][:] = array('d', [5.0, 6.0])
+    assert list(M._values()) == [1.0, 2.0, 5.0, 6.0]
+    with pytest.raises(TypeError):
+        M.data[0] = [7.0, 8.0]
@@ -0,0 +1,34 @@
+import random
+
+import src.nearest_neighbors as nn_module
+from src.nearest_neighbors import brute_force_neighbors
+
+
+def _direct(pts, k):
+    return [sorted((sum((a - b) ** 2 for a, b in zip(p, q)), j)
+                   for j, q in enumerate(pts) if j != i)[:k] for i, p in enumerate(pts)]
+
+
+def test_blocked_brute_force_matches_direct(monkeypatch):
+    monkeypatch.setattr(nn_module, '_QUERY_BLOCK', 7)
+    rng = random.Random(3)
+    pts = [[float(rng.randint(0, 3)) for _ in range(4)] for _ in range(40)]
+    expected = _direct(pts, 3)
+    assert brute_force_neighbors(pts, 3) == expected
+    assert brute_force_neighbors(pts, 3, 10, 25) == expected[10:25]
+
+
+def test_matrix_input_is_not_copied(monkeypatch):
+    from src.Matrix import Matrix
+    rng = random.Random(4)
+    pts = [[rng.random() for _ in range(3)] for _ in range(30)]
+    X = Matrix(pts)
+    expected = _direct(pts, 2)
+
+    def no_copy(self, *args, **kwargs):
+        raise AssertionError("Matrix не должна копироваться")
+
+    monkeypatch.setattr(nn_module, '_QUERY_BLOCK', 8)
+    monkeypatch.setattr(Matrix, '__init__', no_copy)
+    assert nn_module.loo_neighbors(X, 2, 'brute') == expected
+    assert nn_module.loo_neighbors(X, 2, 'kdtree') == expected
@@ -0,0 +1,23 @@
+import random
+
+import src.add_noise_and_compare as noise_module
+from src.Matrix import Matrix
+
+
+def test_serial_study_leaves_no_module_state():
+    rng = random.Random(0)
+    X = Matrix([[rng.gauss(0.0, 3.0 if j == 0 else 1.0) for j in range(4)] for _ in range(40)])
+    serial = noise_module.noise_study(X, [0.1, 0.5], trials=3, n_jobs=1)
+    assert noise_module._context is None
+    assert noise_module.noise_study(X, [0.1, 0.5], trials=3, n_jobs=2) == serial
+
+
+def test_default_worker_count_follows_parallel_setting(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("пул не должен создаваться при одном процессе")
+
+    monkeypatch.setattr(noise_module, 'ProcessPoolExecutor', no_pool)
+    rng = random.Random(1)
+    X = Matrix([[rng.gauss(0.0, 1.0) for _ in range(3)] for _ in range(20)])
+    result = noise_module.noise_study(X, [0.1], trials=2)
+    assert len(result["levels"]) == 1
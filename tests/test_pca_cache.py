@@ -0,0 +1,27 @@
+import math
+import random
+
+import pytest
+
+from src.Matrix import Matrix
+from src.pca import fit_pca
+from src.pca_cache import PCACache
+
+
+def _with_gaps():
+    rng = random.Random(5)
+    rows = [[rng.gauss(0.0, 1.0 + 2 * j) for j in range(4)] for _ in range(30)]
+    for i in range(0, 30, 3):
+        rows[i][i % 4] = math.nan
+    return Matrix(rows)
+
+
+def test_missing_modes_do_not_share_cached_eigenpairs():
+    X = _with_gaps()
+    for solver in ('eigh', 'power', 'subspace'):
+        cache = PCACache()
+        for missing in ('mean', 'pairwise'):
+            cached = fit_pca(X, 2, solver=solver, missing=missing, cache=cache)
+            fresh = fit_pca(X, 2, solver=solver, missing=missing)
+            assert cached[2][:2] == pytest.approx(fresh[2][:2], rel=1e-5)
+            assert cached[3] == pytest.approx(fresh[3], rel=1e-5)
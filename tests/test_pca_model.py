@@ -0,0 +1,31 @@
+import random
+
+import pytest
+
+from src.Matrix import Matrix
+from src.pca_model import PCAModel
+
+
+def _model():
+    rng = random.Random(0)
+    X = Matrix([[rng.gauss(0.0, 1.0) for _ in range(5)] for _ in range(30)])
+    return PCAModel(2, solver='eigh').fit(X)
+
+
+def test_save_load_round_trip(tmp_path):
+    model = _model()
+    path = str(tmp_path / 'model.pcam')
+    model.save(path)
+    loaded = PCAModel.load(path)
+    assert loaded.W == model.W
+    assert loaded.means == model.means
+
+
+@pytest.mark.parametrize('cut', [3, 8])
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_truncated_file_is_rejected(tmp_path, cut, use_mmap):
+    path = tmp_path / 'model.pcam'
+    _model().save(str(path))
+    path.write_bytes(path.read_bytes()[:-cut])
+    with pytest.raises(ValueError):
+        PCAModel.load(str(path), use_mmap=use_mmap)
@@ -0,0 +1,12 @@
+import pytest
+
+from src.Matrix import Matrix
+from src.randomized_pca import randomized_fit
+
+
+def test_k_above_row_count_is_rejected():
+    X = Matrix([[1.0, 0.0, 2.0, 1.0], [0.0, 3.0, 1.0, 2.0], [2.0, 1.0, 0.0, 4.0]])
+    with pytest.raises(ValueError, match=r"\[1, 3\]"):
+        randomized_fit(X, 4, seed=0)
+    W, _, eigenvalues, _, _ = randomized_fit(X, 3, seed=0)
+    assert W.cols == 3 and len(eigenvalues) == 3
@@ -0,0 +1,33 @@
+import random
+import warnings
+
+import pytest
+
+from src.Matrix import Matrix
+from src.top_k_eigen import top_k_eigen
+
+
+def _spd(m, seed=0):
+    rng = random.Random(seed)
+    A = Matrix([[rng.gauss(0.0, 1.0) for _ in range(m)] for _ in range(m)])
+    scale = Matrix([[(1.0 / (1 + i) if i == j else 0.0) for j in range(m)] for i in range(m)])
+    B = A @ scale
+    return B @ B.transpose()
+
+
+def test_warns_when_not_converged():
+    C = _spd(40)
+    with pytest.warns(RuntimeWarning):
+        vals, V = top_k_eigen(C, 3, max_iter=1, seed=0)
+    assert len(vals) == 3 and V.shape() == (40, 3)
+
+
+def test_converged_run_is_silent():
+    C = _spd(40)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        vals, V = top_k_eigen(C, 3, seed=0)
+    for j, lam in enumerate(vals):
+        v = V._column(j).tolist()
+        Cv = [sum(a * b for a, b in zip(row, v)) for row in C.data]
+        assert max(abs(a - lam * b) for a, b in zip(Cv, v)) < 1e-6 * vals[0]
@@ -0,0 +1,56 @@
+import random
+
+import src.top_k_eigen as top_k_module
+from src.Matrix import Matrix
+from src.pca_model import PCAModel
+from src.pca_stats import PCAStats
+from src.pca import fit_pca
+
+
+def _window(start, n=1500, m=60, seed=0):
+    rng = random.Random(seed)
+    scale = [3.0 / (1 + j) if j < 8 else 0.05 for j in range(m)]
+    rows = [[rng.gauss(0.0, 1.0) * s for s in scale] for _ in range(start + n)]
+    return Matrix(rows[start:])
+
+
+def _count_block_iterations(monkeypatch):
+    # Каждая блочная итерация делает ровно одно разложение Рэлея–Ритца
+    calls = []
+    real = top_k_module.symmetric_eigen
+
+    def counting(H, *args, **kwargs):
+        calls.append(H.rows)
+        return real(H, *args, **kwargs)
+
+    monkeypatch.setattr(top_k_module, 'symmetric_eigen', counting)
+    return calls
+
+
+def test_n_iter_counts_block_iterations(monkeypatch):
+    calls = _count_block_iterations(monkeypatch)
+    stats = PCAStats()
+    fit_pca(_window(0), 5, solver='subspace', stats=stats)
+    events = [e for e in stats.iterations if e["solver"] == 'top_k_eigen']
+    assert len(events) == 1 and events[0]["index"] == 5
+    assert stats.n_iter == len(calls) == events[0]["iterations"]
+
+
+def test_warm_start_reports_saved_block_iterations(monkeypatch):
+    calls = _count_block_iterations(monkeypatch)
+    cold = PCAModel(5, solver='subspace').fit(_window(0))
+    cold_calls = len(calls)
+    assert cold.n_iter == cold_calls
+    warm = PCAModel(5, solver='subspace').fit(_window(2), warm_start=cold)
+    assert warm.n_iter == len(calls) - cold_calls
+    assert warm.iterations_saved == cold.n_iter - warm.n_iter
+    assert warm.n_iter < cold.n_iter
+
+
+def test_fit_without_stats_does_not_record(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(PCAStats, 'record_iterations',
+                        lambda self, *args: recorded.append(args))
+    model = PCAModel(5, solver='subspace').fit(_window(0))
+    assert model.n_iter > 0
+    assert recorded == []